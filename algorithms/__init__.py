@@ -4,17 +4,29 @@ Implements various pathfinding and search algorithms.
 """
 
 from .bfs import breadth_first_search, bfs_path
+from .parallel_bfs import parallel_bfs, parallel_bfs_path
+from .direction_optimizing_bfs import direction_optimizing_bfs, direction_optimizing_bfs_path
 from .dfs import depth_first_search, dfs_path
 from .dijkstra import dijkstra, dijkstra_path
+from .dijkstra_grid import dijkstra_grid, dijkstra_grid_path
 from .astar import astar, astar_path
+from .bidirectional_astar import bidirectional_astar, bidirectional_astar_path
 
 __all__ = [
     'breadth_first_search',
     'bfs_path',
+    'parallel_bfs',
+    'parallel_bfs_path',
+    'direction_optimizing_bfs',
+    'direction_optimizing_bfs_path',
     'depth_first_search',
     'dfs_path',
     'dijkstra',
     'dijkstra_path',
+    'dijkstra_grid',
+    'dijkstra_grid_path',
     'astar',
-    'astar_path'
+    'astar_path',
+    'bidirectional_astar',
+    'bidirectional_astar_path'
 ]
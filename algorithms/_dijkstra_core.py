@@ -0,0 +1,59 @@
+"""
+Dijkstra core over flat CSR arrays.
+Works purely on integer node ids so the hot loop touches only lists of
+ints and floats; callers translate ids back to GraphNode values.
+"""
+
+import heapq
+from typing import List, Tuple
+
+INF = float('inf')
+
+
+def _dijkstra_core(indptr: List[int], indices: List[int], weights: List[float],
+                   start: int, goal: int) -> Tuple[List[float], List[int], List[int]]:
+    """
+    Run Dijkstra from start until goal is settled (or the queue empties).
+    
+    Args:
+        indptr, indices, weights: Graph adjacency in CSR form
+        start: Start node id
+        goal: Goal node id
+    
+    Returns:
+        Tuple of (distance, parent, settled_order) where parent[i] is -1 for
+        the start node and for nodes never reached
+    """
+    num_nodes = len(indptr) - 1
+    distance: List[float] = [INF] * num_nodes
+    distance[start] = 0
+    parent: List[int] = [-1] * num_nodes
+    settled_order: List[int] = []
+    
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    # Node ids are ints, so they break priority ties directly
+    pq = [(0, start)]
+    
+    while pq:
+        current_dist, current = heappop(pq)
+        
+        # Lazy decrease-key: skip entries superseded by a shorter distance
+        if current_dist > distance[current]:
+            continue
+        
+        settled_order.append(current)
+        
+        if current == goal:
+            break
+        
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            new_distance = current_dist + weights[k]
+            
+            if new_distance < distance[neighbor]:
+                distance[neighbor] = new_distance
+                parent[neighbor] = current
+                heappush(pq, (new_distance, neighbor))
+    
+    return distance, parent, settled_order
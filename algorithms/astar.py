@@ -6,8 +6,14 @@ Time Complexity: O((V + E) log V) with binary heap (depends on heuristic quality
 Space Complexity: O(V) for distance maps and priority queue
 """
 
+import heapq
 from typing import List, Optional, Dict, Callable
-from data_structures import Graph, GraphNode, PriorityQueue
+from data_structures import Graph
+from .heuristics import bind_heuristic
+# Re-exported for callers that import the heuristics from this module
+from .heuristics import manhattan_distance, euclidean_distance, zero_heuristic
+
+INF = float('inf')
 
 
 def astar(graph: Graph, start_value, goal_value, heuristic: Callable[[any, any], float]) -> Dict:
@@ -36,74 +42,85 @@ def astar(graph: Graph, start_value, goal_value, heuristic: Callable[[any, any],
         return {
             'found': False,
             'path': [],
-            'cost': float('inf'),
+            'cost': INF,
             'visited': [],
             'nodes_explored': 0
         }
     
-    # g_score: actual cost from start to node
-    g_score: Dict[GraphNode, float] = {node: float('inf') for node in graph.get_all_nodes()}
-    g_score[start_node] = 0
+    # Search over the graph's cached CSR; per-node state is indexed by id
+    indptr, indices, weights, id_to_node, _ = graph.csr()
+    num_nodes = len(id_to_node)
+    start_id = start_node._id
+    goal_id = goal_node._id
     
-    # f_score: g_score + heuristic (estimated total cost)
-    f_score: Dict[GraphNode, float] = {node: float('inf') for node in graph.get_all_nodes()}
-    f_score[start_node] = heuristic(start_value, goal_value)
+    # g_score: actual cost from start to node. The f-score (g + heuristic)
+    # is only needed for ordering, so it lives in the heap entry alone.
+    g_score: List[float] = [INF] * num_nodes
+    g_score[start_id] = 0
     
-    parent: Dict[GraphNode, Optional[GraphNode]] = {start_node: None}
-    visited = set()
+    parent: List[int] = [-1] * num_nodes
+    # Expanded nodes are closed and never reopened, so each is counted once
+    closed = bytearray(num_nodes)
     visited_order = []
     
-    # Priority queue: (f_score, node)
-    pq = PriorityQueue()
-    pq.insert(start_node, f_score[start_node])
+    # The goal is fixed for the whole search; bind it once
+    h = bind_heuristic(heuristic, goal_value)
+    
+    # Priority queue: (f_score, node id, g_score); ids break ties directly
+    # Bind the heap helpers locally: they run once per pop/relaxation
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    pq = [(h(start_value), start_id, 0)]
     
-    while not pq.is_empty():
-        current_f, current = pq.extract_min()
+    while pq:
+        _, current, g_current = heappop(pq)
         
-        if current in visited:
+        # Lazy decrease-key: entries for already expanded nodes are stale
+        if closed[current]:
             continue
         
-        visited.add(current)
-        visited_order.append(current.value)
+        closed[current] = 1
+        visited_order.append(id_to_node[current].value)
         
         # Goal reached
-        if current == goal_node:
+        if current == goal_id:
             # Reconstruct path
             path = []
-            node = goal_node
-            while node is not None:
-                path.append(node.value)
-                node = parent.get(node)
+            node_id = goal_id
+            while node_id != -1:
+                path.append(id_to_node[node_id].value)
+                node_id = parent[node_id]
             path.reverse()
             
             return {
                 'found': True,
                 'path': path,
-                'cost': g_score[goal_node],
+                'cost': g_current,
                 'visited': visited_order,
-                'nodes_explored': len(visited)
+                'nodes_explored': len(visited_order)
             }
         
         # Explore neighbors
-        for neighbor in current.get_neighbors():
-            if neighbor in visited:
+        lo, hi = indptr[current], indptr[current + 1]
+        for neighbor, edge_weight in zip(indices[lo:hi], weights[lo:hi]):
+            if closed[neighbor]:
                 continue
             
-            tentative_g_score = g_score[current] + current.get_weight(neighbor)
+            tentative_g_score = g_current + edge_weight
             
             if tentative_g_score < g_score[neighbor]:
                 # This path to neighbor is better
                 parent[neighbor] = current
                 g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor.value, goal_value)
-                pq.insert(neighbor, f_score[neighbor])
+                f = tentative_g_score + h(id_to_node[neighbor].value)
+                heappush(pq, (f, neighbor, tentative_g_score))
     
     return {
         'found': False,
         'path': [],
-        'cost': float('inf'),
+        'cost': INF,
         'visited': visited_order,
-        'nodes_explored': len(visited)
+        'nodes_explored': len(visited_order)
     }
 
 
@@ -111,32 +128,11 @@ def astar_path(graph: Graph, start_value, goal_value, heuristic: Callable[[any,
     """
     Simplified A* that returns just the path.
     
+    For long routes on large graphs, bidirectional_astar_path expands fewer
+    nodes but needs a symmetric, consistent heuristic.
+    
     Returns:
         List of node values representing the optimal path, or None if no path exists
     """
     result = astar(graph, start_value, goal_value, heuristic)
     return result['path'] if result['found'] else None
-
-
-# Common heuristic functions
-def manhattan_distance(pos1: tuple, pos2: tuple) -> float:
-    """
-    Manhattan distance heuristic for grid-based problems.
-    Assumes positions are (x, y) tuples.
-    """
-    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-
-
-def euclidean_distance(pos1: tuple, pos2: tuple) -> float:
-    """
-    Euclidean distance heuristic.
-    Assumes positions are (x, y) tuples.
-    """
-    return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
-
-
-def zero_heuristic(node1: any, node2: any) -> float:
-    """
-    Zero heuristic (makes A* behave like Dijkstra).
-    """
-    return 0.0
@@ -6,8 +6,9 @@ Time Complexity: O(V + E) where V is vertices and E is edges
 Space Complexity: O(V) for the queue and visited set
 """
 
-from typing import List, Optional, Set, Dict
-from data_structures import Graph, GraphNode, Queue
+from collections import deque
+from typing import List, Optional, Dict
+from data_structures import Graph
 
 
 def breadth_first_search(graph: Graph, start_value, goal_value) -> Dict:
@@ -37,46 +38,51 @@ def breadth_first_search(graph: Graph, start_value, goal_value) -> Dict:
             'nodes_explored': 0
         }
     
-    queue = Queue()
-    queue.enqueue(start_node)
+    # Search over the graph's cached CSR; per-node state is indexed by id
+    indptr, indices, _, id_to_node, _ = graph.csr()
+    num_nodes = len(id_to_node)
+    start_id = start_node._id
+    goal_id = goal_node._id
     
-    visited: Set[GraphNode] = set()
-    visited.add(start_node)
+    queue = deque([start_id])
     
-    parent: Dict[GraphNode, Optional[GraphNode]] = {start_node: None}
+    visited = bytearray(num_nodes)
+    visited[start_id] = 1
+    
+    parent: List[int] = [-1] * num_nodes
     visited_order: List = [start_value]
     
-    while not queue.is_empty():
-        current = queue.dequeue()
+    while queue:
+        current = queue.popleft()
         
-        if current == goal_node:
+        if current == goal_id:
             # Reconstruct path
             path = []
-            node = goal_node
-            while node is not None:
-                path.append(node.value)
-                node = parent[node]
+            node_id = goal_id
+            while node_id != -1:
+                path.append(id_to_node[node_id].value)
+                node_id = parent[node_id]
             path.reverse()
             
             return {
                 'found': True,
                 'path': path,
                 'visited': visited_order,
-                'nodes_explored': len(visited)
+                'nodes_explored': len(visited_order)
             }
         
-        for neighbor in current.get_neighbors():
-            if neighbor not in visited:
-                visited.add(neighbor)
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
                 parent[neighbor] = current
-                queue.enqueue(neighbor)
-                visited_order.append(neighbor.value)
+                queue.append(neighbor)
+                visited_order.append(id_to_node[neighbor].value)
     
     return {
         'found': False,
         'path': [],
         'visited': visited_order,
-        'nodes_explored': len(visited)
+        'nodes_explored': len(visited_order)
     }
 
 
@@ -0,0 +1,203 @@
+"""
+Bidirectional A* Algorithm
+Runs two A* searches, forward from the start and backward from the goal,
+and stops once the frontiers prove that no shorter meeting path exists.
+
+Both searches use the average potential
+    p(v) = (h(v, goal) - h(v, start)) / 2
+forward and -p(v) backward, which keeps the two searches consistent with
+each other so the simple stopping rule top_f + top_b >= best is exact.
+The same bound is applied per edge: a neighbor whose key plus the top key
+of the opposite queue already reaches the best meeting cost cannot lie on
+a shorter path and is never queued.
+
+Time Complexity: O((V + E) log V) worst case, typically far fewer expansions
+                 than unidirectional A* on long paths
+Space Complexity: O(V) for two sets of scores, parents and priority queues
+"""
+
+import heapq
+from typing import List, Optional, Dict, Callable
+from data_structures import Graph
+from .heuristics import bind_heuristic
+
+INF = float('inf')
+
+
+def bidirectional_astar(graph: Graph, start_value, goal_value,
+                        heuristic: Callable[[any, any], float]) -> Dict:
+    """
+    Perform bidirectional A* to find an optimal path from start to goal.
+    
+    The heuristic must be consistent and symmetric (h(a, b) == h(b, a)),
+    as geometric distances are, because the backward search evaluates it
+    against the start node.
+    
+    Args:
+        graph: The graph to search (must have non-negative weights)
+        start_value: Starting node value
+        goal_value: Goal node value
+        heuristic: Function that estimates cost between two node values
+                   Should take (node_value, target_value) and return float
+    
+    Returns:
+        Dictionary containing:
+        - 'found': Boolean indicating if goal was found
+        - 'path': List of node values from start to goal
+        - 'cost': Total actual cost of the path
+        - 'visited': List of all visited nodes in order (both directions)
+        - 'nodes_explored': Number of distinct nodes explored
+    """
+    start_node = graph.get_node(start_value)
+    goal_node = graph.get_node(goal_value)
+    
+    if not start_node or not goal_node:
+        return {
+            'found': False,
+            'path': [],
+            'cost': INF,
+            'visited': [],
+            'nodes_explored': 0
+        }
+    
+    if start_node is goal_node:
+        return {
+            'found': True,
+            'path': [start_value],
+            'cost': 0,
+            'visited': [start_value],
+            'nodes_explored': 1
+        }
+    
+    # Forward search follows out-edges, backward search follows in-edges;
+    # both come from the graph's cached CSR (shared when undirected)
+    indptr, indices, weights, id_to_node, _ = graph.csr()
+    rev_indptr, rev_indices, rev_weights = graph.reverse_csr()
+    num_nodes = len(id_to_node)
+    start_id = start_node._id
+    goal_id = goal_node._id
+    
+    h_goal = bind_heuristic(heuristic, goal_value)
+    h_start = bind_heuristic(heuristic, start_value)
+    
+    def potential(value) -> float:
+        return (h_goal(value) - h_start(value)) / 2
+    
+    # Per-direction state indexed by node id
+    g_forward: List[float] = [INF] * num_nodes
+    g_backward: List[float] = [INF] * num_nodes
+    parent_forward: List[int] = [-1] * num_nodes
+    parent_backward: List[int] = [-1] * num_nodes
+    closed_forward = bytearray(num_nodes)
+    closed_backward = bytearray(num_nodes)
+    visited_order = []
+    
+    g_forward[start_id] = 0
+    g_backward[goal_id] = 0
+    
+    # Priority queues: (key, node id); ids break ties directly
+    # Bind the heap helpers locally: they run once per pop/relaxation
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    pq_forward = [(potential(start_value), start_id)]
+    pq_backward = [(-potential(goal_value), goal_id)]
+    
+    best_cost = INF
+    meeting_id = -1
+    
+    while pq_forward and pq_backward:
+        top_forward = pq_forward[0][0]
+        top_backward = pq_backward[0][0]
+        
+        # No unexplored path can beat the best meeting found so far
+        if top_forward + top_backward >= best_cost:
+            break
+        
+        # Expand whichever frontier has the smaller key
+        if top_forward <= top_backward:
+            pq, g_this, g_other = pq_forward, g_forward, g_backward
+            top_other = top_backward
+            parent, closed, closed_other = parent_forward, closed_forward, closed_backward
+            adj_ptr, adj_idx, adj_w, sign = indptr, indices, weights, 1
+        else:
+            pq, g_this, g_other = pq_backward, g_backward, g_forward
+            top_other = top_forward
+            parent, closed, closed_other = parent_backward, closed_backward, closed_forward
+            adj_ptr, adj_idx, adj_w, sign = rev_indptr, rev_indices, rev_weights, -1
+        
+        _, current = heappop(pq)
+        
+        if closed[current]:
+            continue
+        
+        closed[current] = 1
+        if not closed_other[current]:
+            visited_order.append(id_to_node[current].value)
+        
+        g_current = g_this[current]
+        lo, hi = adj_ptr[current], adj_ptr[current + 1]
+        for neighbor, edge_weight in zip(adj_idx[lo:hi], adj_w[lo:hi]):
+            if closed[neighbor]:
+                continue
+            
+            tentative_g_score = g_current + edge_weight
+            
+            if tentative_g_score < g_this[neighbor]:
+                g_this[neighbor] = tentative_g_score
+                parent[neighbor] = current
+                
+                # Both searches have reached this node: candidate meeting point
+                total = tentative_g_score + g_other[neighbor]
+                if total < best_cost:
+                    best_cost = total
+                    meeting_id = neighbor
+                
+                # Lower bound on any path through this edge: the opposite
+                # search cannot finish it for less than its smallest key
+                key = tentative_g_score + sign * potential(id_to_node[neighbor].value)
+                if key + top_other >= best_cost:
+                    continue
+                
+                heappush(pq, (key, neighbor))
+    
+    if meeting_id == -1:
+        return {
+            'found': False,
+            'path': [],
+            'cost': INF,
+            'visited': visited_order,
+            'nodes_explored': len(visited_order)
+        }
+    
+    # Reconstruct path: start -> meeting node, then meeting node -> goal
+    path = []
+    node_id = meeting_id
+    while node_id != -1:
+        path.append(id_to_node[node_id].value)
+        node_id = parent_forward[node_id]
+    path.reverse()
+    
+    node_id = parent_backward[meeting_id]
+    while node_id != -1:
+        path.append(id_to_node[node_id].value)
+        node_id = parent_backward[node_id]
+    
+    return {
+        'found': True,
+        'path': path,
+        'cost': best_cost,
+        'visited': visited_order,
+        'nodes_explored': len(visited_order)
+    }
+
+
+def bidirectional_astar_path(graph: Graph, start_value, goal_value,
+                             heuristic: Callable[[any, any], float]) -> Optional[List]:
+    """
+    Simplified bidirectional A* that returns just the path.
+    
+    Returns:
+        List of node values representing the optimal path, or None if no path exists
+    """
+    result = bidirectional_astar(graph, start_value, goal_value, heuristic)
+    return result['path'] if result['found'] else None
@@ -6,8 +6,8 @@ Time Complexity: O(V + E) where V is vertices and E is edges
 Space Complexity: O(V) for the stack and visited set
 """
 
-from typing import List, Optional, Set, Dict
-from data_structures import Graph, GraphNode, Stack
+from typing import List, Optional, Dict
+from data_structures import Graph
 
 
 def depth_first_search(graph: Graph, start_value, goal_value) -> Dict:
@@ -37,51 +37,55 @@ def depth_first_search(graph: Graph, start_value, goal_value) -> Dict:
             'nodes_explored': 0
         }
     
-    stack = Stack()
-    stack.push(start_node)
+    # Search over the graph's cached CSR; per-node state is indexed by id
+    indptr, indices, _, id_to_node, _ = graph.csr()
+    num_nodes = len(id_to_node)
+    goal_id = goal_node._id
     
-    visited: Set[GraphNode] = set()
-    parent: Dict[GraphNode, Optional[GraphNode]] = {start_node: None}
+    # A plain list is the LIFO stack: append/pop are O(1) and C-level
+    stack = [start_node._id]
+    
+    visited = bytearray(num_nodes)
+    parent: List[int] = [-1] * num_nodes
     visited_order: List = []
     
-    while not stack.is_empty():
+    while stack:
         current = stack.pop()
         
-        if current in visited:
+        if visited[current]:
             continue
         
-        visited.add(current)
-        visited_order.append(current.value)
+        visited[current] = 1
+        visited_order.append(id_to_node[current].value)
         
-        if current == goal_node:
+        if current == goal_id:
             # Reconstruct path
             path = []
-            node = goal_node
-            while node is not None:
-                path.append(node.value)
-                node = parent[node]
+            node_id = goal_id
+            while node_id != -1:
+                path.append(id_to_node[node_id].value)
+                node_id = parent[node_id]
             path.reverse()
             
             return {
                 'found': True,
                 'path': path,
                 'visited': visited_order,
-                'nodes_explored': len(visited)
+                'nodes_explored': len(visited_order)
             }
         
         # Push neighbors onto stack (reverse order for consistent exploration)
-        neighbors = current.get_neighbors()
-        for neighbor in reversed(neighbors):
-            if neighbor not in visited:
-                if neighbor not in parent:
+        for neighbor in reversed(indices[indptr[current]:indptr[current + 1]]):
+            if not visited[neighbor]:
+                if parent[neighbor] == -1:
                     parent[neighbor] = current
-                stack.push(neighbor)
+                stack.append(neighbor)
     
     return {
         'found': False,
         'path': [],
         'visited': visited_order,
-        'nodes_explored': len(visited)
+        'nodes_explored': len(visited_order)
     }
 
 
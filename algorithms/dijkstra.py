@@ -7,7 +7,10 @@ Space Complexity: O(V) for distance map and priority queue
 """
 
 from typing import List, Optional, Dict
-from data_structures import Graph, GraphNode, PriorityQueue
+from data_structures import Graph
+from ._dijkstra_core import _dijkstra_core
+
+INF = float('inf')
 
 
 def dijkstra(graph: Graph, start_value, goal_value) -> Dict:
@@ -34,69 +37,43 @@ def dijkstra(graph: Graph, start_value, goal_value) -> Dict:
         return {
             'found': False,
             'path': [],
-            'cost': float('inf'),
+            'cost': INF,
             'visited': [],
             'nodes_explored': 0
         }
     
-    # Initialize distances and parent tracking
-    distance: Dict[GraphNode, float] = {node: float('inf') for node in graph.get_all_nodes()}
-    distance[start_node] = 0
+    indptr, indices, weights, id_to_node, _ = graph.csr()
+    distance, parent, settled_order = _dijkstra_core(
+        indptr, indices, weights, start_node._id, goal_node._id
+    )
     
-    parent: Dict[GraphNode, Optional[GraphNode]] = {start_node: None}
-    visited = set()
-    visited_order = []
+    # Translate node ids back to values
+    visited_order = [id_to_node[node_id].value for node_id in settled_order]
+    goal_id = goal_node._id
     
-    # Priority queue: (distance, node)
-    pq = PriorityQueue()
-    pq.insert(start_node, 0)
+    if distance[goal_id] == INF:
+        return {
+            'found': False,
+            'path': [],
+            'cost': INF,
+            'visited': visited_order,
+            'nodes_explored': len(visited_order)
+        }
     
-    while not pq.is_empty():
-        current_dist, current = pq.extract_min()
-        
-        if current in visited:
-            continue
-        
-        visited.add(current)
-        visited_order.append(current.value)
-        
-        # Early exit if we reached the goal
-        if current == goal_node:
-            # Reconstruct path
-            path = []
-            node = goal_node
-            while node is not None:
-                path.append(node.value)
-                node = parent.get(node)
-            path.reverse()
-            
-            return {
-                'found': True,
-                'path': path,
-                'cost': distance[goal_node],
-                'visited': visited_order,
-                'nodes_explored': len(visited)
-            }
-        
-        # Explore neighbors
-        for neighbor in current.get_neighbors():
-            if neighbor in visited:
-                continue
-            
-            edge_weight = current.get_weight(neighbor)
-            new_distance = distance[current] + edge_weight
-            
-            if new_distance < distance[neighbor]:
-                distance[neighbor] = new_distance
-                parent[neighbor] = current
-                pq.insert(neighbor, new_distance)
+    # Reconstruct path
+    path = []
+    node_id = goal_id
+    while node_id != -1:
+        path.append(id_to_node[node_id].value)
+        node_id = parent[node_id]
+    path.reverse()
     
     return {
-        'found': False,
-        'path': [],
-        'cost': float('inf'),
+        'found': True,
+        'path': path,
+        'cost': distance[goal_id],
         'visited': visited_order,
-        'nodes_explored': len(visited)
+        'nodes_explored': len(visited_order)
     }
 
 
@@ -0,0 +1,137 @@
+"""
+Grid Dijkstra's Algorithm
+Dijkstra specialised for 4-connected 2D grids with per-cell entry costs.
+
+Cells are addressed by a flat index (row * cols + col) so distances and
+parents live in flat lists, and neighbors come from index offsets instead
+of an adjacency structure. No Graph needs to be built.
+
+Time Complexity: O(R*C log(R*C)) with binary heap
+Space Complexity: O(R*C) for distance/parent arrays and priority queue
+"""
+
+import heapq
+from typing import List, Optional, Dict, Tuple
+
+INF = float('inf')
+
+
+def dijkstra_grid(cost: List[List[Optional[float]]], start: Tuple[int, int],
+                  goal: Tuple[int, int]) -> Dict:
+    """
+    Perform Dijkstra's algorithm on a 2D cost grid.
+    
+    Args:
+        cost: Grid of non-negative costs for entering each cell;
+              None or INF marks an impassable cell
+        start: Starting (row, col)
+        goal: Goal (row, col)
+    
+    Returns:
+        Dictionary containing:
+        - 'found': Boolean indicating if goal was found
+        - 'path': List of (row, col) cells from start to goal
+        - 'cost': Total cost of the path (start cell excluded)
+        - 'visited': List of all visited cells in order
+        - 'nodes_explored': Number of cells explored
+    """
+    rows = len(cost)
+    cols = len(cost[0]) if rows else 0
+    
+    # Flatten once; impassable cells become INF
+    flat_cost: List[float] = [
+        INF if c is None else c for row in cost for c in row
+    ]
+    
+    def in_bounds(cell: Tuple[int, int]) -> bool:
+        return 0 <= cell[0] < rows and 0 <= cell[1] < cols
+    
+    if (not in_bounds(start) or not in_bounds(goal)
+            or flat_cost[start[0] * cols + start[1]] == INF
+            or flat_cost[goal[0] * cols + goal[1]] == INF):
+        return {
+            'found': False,
+            'path': [],
+            'cost': INF,
+            'visited': [],
+            'nodes_explored': 0
+        }
+    
+    num_cells = rows * cols
+    start_idx = start[0] * cols + start[1]
+    goal_idx = goal[0] * cols + goal[1]
+    
+    distance: List[float] = [INF] * num_cells
+    distance[start_idx] = 0
+    parent: List[int] = [-1] * num_cells
+    visited_order = []
+    
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    # Flat indices are ints, so they break priority ties directly
+    pq = [(0, start_idx)]
+    
+    while pq:
+        current_dist, current = heappop(pq)
+        
+        # Lazy decrease-key: skip entries superseded by a shorter distance
+        if current_dist > distance[current]:
+            continue
+        
+        visited_order.append(divmod(current, cols))
+        
+        if current == goal_idx:
+            # Reconstruct path
+            path = []
+            idx = goal_idx
+            while idx != -1:
+                path.append(divmod(idx, cols))
+                idx = parent[idx]
+            path.reverse()
+            
+            return {
+                'found': True,
+                'path': path,
+                'cost': current_dist,
+                'visited': visited_order,
+                'nodes_explored': len(visited_order)
+            }
+        
+        col = current % cols
+        
+        # Up, down, left, right; horizontal moves must stay on the same row
+        for neighbor, valid in (
+            (current - cols, current >= cols),
+            (current + cols, current + cols < num_cells),
+            (current - 1, col > 0),
+            (current + 1, col < cols - 1),
+        ):
+            if not valid:
+                continue
+            
+            new_distance = current_dist + flat_cost[neighbor]
+            
+            if new_distance < distance[neighbor]:
+                distance[neighbor] = new_distance
+                parent[neighbor] = current
+                heappush(pq, (new_distance, neighbor))
+    
+    return {
+        'found': False,
+        'path': [],
+        'cost': INF,
+        'visited': visited_order,
+        'nodes_explored': len(visited_order)
+    }
+
+
+def dijkstra_grid_path(cost: List[List[Optional[float]]], start: Tuple[int, int],
+                       goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    """
+    Simplified grid Dijkstra that returns just the path.
+    
+    Returns:
+        List of (row, col) cells representing the cheapest path, or None if no path exists
+    """
+    result = dijkstra_grid(cost, start, goal)
+    return result['path'] if result['found'] else None
@@ -0,0 +1,162 @@
+"""
+Direction-Optimizing Breadth-First Search
+Level-synchronous BFS that switches between two ways of building the next
+frontier (Beamer, Asanovic and Patterson):
+
+- top-down: every frontier node scans its out-edges for unvisited nodes
+- bottom-up: every unvisited node scans its in-edges for a frontier node
+  and stops at the first one found
+
+Bottom-up wins once the frontier is large, because most unvisited nodes
+find a parent after a few edges while top-down would examine every edge
+leaving the frontier. The search switches to bottom-up when the frontier's
+out-edges exceed 1/alpha of the out-edges of unvisited nodes, and back to
+top-down when a shrinking frontier holds fewer than 1/beta of all nodes.
+Frontiers below that size never go bottom-up: on sparse, long graphs such
+as mazes a full scan of the unvisited nodes costs more than it saves.
+
+Time Complexity: O(V + E) top-down; bottom-up levels may rescan the
+                 unvisited nodes, but typically touch far fewer edges
+Space Complexity: O(V) for the frontier, visited map and parents
+"""
+
+from typing import List, Optional, Dict
+from data_structures import Graph
+
+# Switching thresholds from the original paper
+ALPHA = 14
+BETA = 24
+
+
+def direction_optimizing_bfs(graph: Graph, start_value, goal_value,
+                             alpha: float = ALPHA, beta: float = BETA) -> Dict:
+    """
+    Perform direction-optimizing BFS to find a shortest unweighted path.
+    
+    Args:
+        graph: The graph to search
+        start_value: Starting node value
+        goal_value: Goal node value
+        alpha: Switch to bottom-up when frontier edges > unvisited edges / alpha
+        beta: Switch back to top-down when frontier size < node count / beta
+    
+    Returns:
+        Dictionary containing:
+        - 'found': Boolean indicating if goal was found
+        - 'path': List of node values from start to goal
+        - 'visited': List of all visited nodes in order
+        - 'nodes_explored': Number of nodes explored
+    """
+    start_node = graph.get_node(start_value)
+    goal_node = graph.get_node(goal_value)
+    
+    if not start_node or not goal_node:
+        return {
+            'found': False,
+            'path': [],
+            'visited': [],
+            'nodes_explored': 0
+        }
+    
+    # Top-down follows out-edges, bottom-up follows in-edges
+    indptr, indices, _, id_to_node, _ = graph.csr()
+    rev_indptr, rev_indices, _ = graph.reverse_csr()
+    num_nodes = len(id_to_node)
+    start_id = start_node._id
+    goal_id = goal_node._id
+    
+    visited = bytearray(num_nodes)
+    visited[start_id] = 1
+    
+    parent: List[int] = [-1] * num_nodes
+    visited_order: List = [start_value]
+    frontier = [start_id]
+    found = start_id == goal_id
+    
+    # Out-edges leaving the frontier and leaving still-unvisited nodes
+    frontier_edges = indptr[start_id + 1] - indptr[start_id]
+    unvisited_edges = len(indices) - frontier_edges
+    bottom_up = False
+    previous_size = 0
+    # Candidates for the bottom-up scan, narrowed on every bottom-up level
+    unvisited: Optional[List[int]] = None
+    
+    while frontier and not found:
+        size = len(frontier)
+        if bottom_up:
+            if size < previous_size and size * beta < num_nodes:
+                bottom_up = False
+        elif frontier_edges * alpha > unvisited_edges and size * beta >= num_nodes:
+            bottom_up = True
+        previous_size = size
+        
+        next_frontier: List[int] = []
+        push = next_frontier.append
+        
+        if bottom_up:
+            in_frontier = bytearray(num_nodes)
+            for current in frontier:
+                in_frontier[current] = 1
+            
+            remaining: List[int] = []
+            for node_id in (range(num_nodes) if unvisited is None else unvisited):
+                if visited[node_id]:
+                    continue
+                
+                # The first frontier predecessor becomes the parent
+                for predecessor in rev_indices[rev_indptr[node_id]:rev_indptr[node_id + 1]]:
+                    if in_frontier[predecessor]:
+                        visited[node_id] = 1
+                        parent[node_id] = predecessor
+                        push(node_id)
+                        break
+                else:
+                    remaining.append(node_id)
+            unvisited = remaining
+        else:
+            for current in frontier:
+                for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        parent[neighbor] = current
+                        push(neighbor)
+        
+        visited_order.extend(id_to_node[node_id].value for node_id in next_frontier)
+        frontier_edges = sum(indptr[node_id + 1] - indptr[node_id] for node_id in next_frontier)
+        unvisited_edges -= frontier_edges
+        found = visited[goal_id] == 1
+        frontier = next_frontier
+    
+    if not found:
+        return {
+            'found': False,
+            'path': [],
+            'visited': visited_order,
+            'nodes_explored': len(visited_order)
+        }
+    
+    # Reconstruct path
+    path = []
+    node_id = goal_id
+    while node_id != -1:
+        path.append(id_to_node[node_id].value)
+        node_id = parent[node_id]
+    path.reverse()
+    
+    return {
+        'found': True,
+        'path': path,
+        'visited': visited_order,
+        'nodes_explored': len(visited_order)
+    }
+
+
+def direction_optimizing_bfs_path(graph: Graph, start_value, goal_value) -> Optional[List]:
+    """
+    Simplified direction-optimizing BFS that returns just the path.
+    
+    Returns:
+        List of node values representing the path, or None if no path exists
+    """
+    result = direction_optimizing_bfs(graph, start_value, goal_value)
+    return result['path'] if result['found'] else None
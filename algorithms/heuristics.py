@@ -0,0 +1,69 @@
+"""
+Heuristic Functions
+Distance estimates for A* and bidirectional A*, plus a helper that binds
+the fixed target once per search so the hot loop calls a one-argument
+closure instead of re-indexing the target tuple on every relaxation.
+"""
+
+import math
+from typing import Callable
+
+
+def manhattan_distance(pos1: tuple, pos2: tuple) -> float:
+    """
+    Manhattan distance heuristic for grid-based problems.
+    Assumes positions are (x, y) tuples.
+    """
+    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+
+def euclidean_distance(pos1: tuple, pos2: tuple) -> float:
+    """
+    Euclidean distance heuristic.
+    Assumes positions are (x, y) tuples.
+    """
+    return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
+
+
+def zero_heuristic(node1: any, node2: any) -> float:
+    """
+    Zero heuristic (makes A* behave like Dijkstra).
+    """
+    return 0.0
+
+
+def bind_heuristic(heuristic: Callable[[any, any], float], target) -> Callable[[any], float]:
+    """
+    Fix the target argument of a two-argument heuristic.
+    
+    The built-in Manhattan and Euclidean heuristics on (x, y, ...) targets
+    are replaced by closures over the target coordinates; like the
+    heuristics themselves they read only the first two items of each
+    position. Any other heuristic or target is wrapped as-is.
+    
+    Args:
+        heuristic: Function taking (node_value, target_value)
+        target: Target value that stays fixed for the whole search
+    
+    Returns:
+        Function taking a node value and returning the estimate to target
+    """
+    if isinstance(target, (tuple, list)) and len(target) >= 2:
+        target_x, target_y = target[0], target[1]
+        
+        if heuristic is manhattan_distance:
+            def bound(pos) -> float:
+                return abs(pos[0] - target_x) + abs(pos[1] - target_y)
+            return bound
+        
+        if heuristic is euclidean_distance:
+            hypot = math.hypot
+            
+            def bound(pos) -> float:
+                return hypot(pos[0] - target_x, pos[1] - target_y)
+            return bound
+    
+    if heuristic is zero_heuristic:
+        return lambda value: 0.0
+    
+    return lambda value: heuristic(value, target)
@@ -0,0 +1,149 @@
+"""
+Parallel Breadth-First Search
+Level-synchronous BFS: every node of the current frontier is expanded in
+parallel, then the discovered neighbors are merged into the next frontier.
+
+Workers only read the CSR arrays and the visited map; each returns its
+own list of (neighbor, parent) candidates. A sequential merge in frontier
+order claims unvisited nodes, so the resulting parents and visit order
+match the sequential BFS. Workers are threads, so under CPython's GIL the
+expansion step overlaps rather than scales; the frontier is still the
+right grain for an interpreter or extension that releases the GIL.
+
+Time Complexity: O(V + E) work, O(D) levels where D is the graph diameter
+Space Complexity: O(V) for the frontier, visited map and parents
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict
+from data_structures import Graph
+
+# Frontiers smaller than this are expanded inline; dispatch would dominate
+PARALLEL_FRONTIER_THRESHOLD = 1024
+
+
+def _expand(indptr: List[int], indices: List[int], visited: bytearray,
+            frontier: List[int], lo: int, hi: int) -> List[int]:
+    """
+    Collect unvisited neighbors of frontier[lo:hi].
+    
+    Returns:
+        Flat list alternating neighbor id and parent id
+    """
+    found = []
+    append = found.append
+    for current in frontier[lo:hi]:
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if not visited[neighbor]:
+                append(neighbor)
+                append(current)
+    return found
+
+
+def parallel_bfs(graph: Graph, start_value, goal_value,
+                 max_workers: Optional[int] = None) -> Dict:
+    """
+    Perform level-synchronous BFS with a thread pool to find a path.
+    
+    Args:
+        graph: The graph to search
+        start_value: Starting node value
+        goal_value: Goal node value
+        max_workers: Thread pool size (ThreadPoolExecutor default if None)
+    
+    Returns:
+        Dictionary containing:
+        - 'found': Boolean indicating if goal was found
+        - 'path': List of node values from start to goal
+        - 'visited': List of all visited nodes in order
+        - 'nodes_explored': Number of nodes explored
+    """
+    start_node = graph.get_node(start_value)
+    goal_node = graph.get_node(goal_value)
+    
+    if not start_node or not goal_node:
+        return {
+            'found': False,
+            'path': [],
+            'visited': [],
+            'nodes_explored': 0
+        }
+    
+    indptr, indices, _, id_to_node, _ = graph.csr()
+    num_nodes = len(id_to_node)
+    start_id = start_node._id
+    goal_id = goal_node._id
+    
+    visited = bytearray(num_nodes)
+    visited[start_id] = 1
+    
+    parent: List[int] = [-1] * num_nodes
+    visited_order: List = [start_value]
+    frontier = [start_id]
+    found = start_id == goal_id
+    
+    # Same default as ThreadPoolExecutor; used to size frontier chunks
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while frontier and not found:
+            size = len(frontier)
+            if size < PARALLEL_FRONTIER_THRESHOLD:
+                batches = [_expand(indptr, indices, visited, frontier, 0, size)]
+            else:
+                chunk = -(-size // workers)
+                futures = [
+                    pool.submit(_expand, indptr, indices, visited, frontier, lo, lo + chunk)
+                    for lo in range(0, size, chunk)
+                ]
+                batches = [future.result() for future in futures]
+            
+            # Sequential merge in frontier order: the first discoverer wins
+            next_frontier = []
+            for batch in batches:
+                for i in range(0, len(batch), 2):
+                    neighbor = batch[i]
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        parent[neighbor] = batch[i + 1]
+                        next_frontier.append(neighbor)
+                        visited_order.append(id_to_node[neighbor].value)
+            
+            found = visited[goal_id] == 1
+            frontier = next_frontier
+    
+    if not found:
+        return {
+            'found': False,
+            'path': [],
+            'visited': visited_order,
+            'nodes_explored': len(visited_order)
+        }
+    
+    # Reconstruct path
+    path = []
+    node_id = goal_id
+    while node_id != -1:
+        path.append(id_to_node[node_id].value)
+        node_id = parent[node_id]
+    path.reverse()
+    
+    return {
+        'found': True,
+        'path': path,
+        'visited': visited_order,
+        'nodes_explored': len(visited_order)
+    }
+
+
+def parallel_bfs_path(graph: Graph, start_value, goal_value,
+                      max_workers: Optional[int] = None) -> Optional[List]:
+    """
+    Simplified parallel BFS that returns just the path.
+    
+    Returns:
+        List of node values representing the path, or None if no path exists
+    """
+    result = parallel_bfs(graph, start_value, goal_value, max_workers)
+    return result['path'] if result['found'] else None
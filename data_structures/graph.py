@@ -3,23 +3,50 @@ Custom Graph Implementation
 Supports both directed and undirected graphs with weighted edges.
 """
 
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterator, List, Set, Optional, Tuple, ValuesView
+
+INF = float('inf')
 
 
 class GraphNode:
     """Represents a node in the graph."""
     
-    def __init__(self, value):
+    __slots__ = ('value', 'neighbors', '_id', '_nbr_nodes', '_nbr_weights', '_nbr_index')
+    
+    def __init__(self, value, node_id: int = -1):
         self.value = value
+        # Dense integer id assigned by the owning Graph (insertion order)
+        self._id = node_id
         self.neighbors: Dict['GraphNode', float] = {}  # neighbor -> weight
+        # Parallel adjacency arrays for sequential traversal
+        self._nbr_nodes: List['GraphNode'] = []
+        self._nbr_weights: List[float] = []
+        # Slot of each neighbor in the parallel arrays, for O(1) re-weighting
+        self._nbr_index: Dict['GraphNode', int] = {}
     
     def add_neighbor(self, neighbor: 'GraphNode', weight: float = 1.0):
         """Add a neighbor with an optional weight."""
+        slot = self._nbr_index.get(neighbor)
+        if slot is not None:
+            self._nbr_weights[slot] = weight
+        else:
+            self._nbr_index[neighbor] = len(self._nbr_nodes)
+            self._nbr_nodes.append(neighbor)
+            self._nbr_weights.append(weight)
         self.neighbors[neighbor] = weight
     
     def get_neighbors(self) -> List['GraphNode']:
-        """Return list of neighboring nodes."""
-        return list(self.neighbors.keys())
+        """
+        Return list of neighboring nodes.
+        
+        The internal adjacency list is returned without copying;
+        callers must not mutate it.
+        """
+        return self._nbr_nodes
+    
+    def iter_neighbors_with_weights(self) -> Iterator[Tuple['GraphNode', float]]:
+        """Iterate (neighbor, weight) pairs without building an intermediate list."""
+        return zip(self._nbr_nodes, self._nbr_weights)
     
     def get_weight(self, neighbor: 'GraphNode') -> float:
         """Get the weight of edge to a neighbor."""
@@ -48,17 +75,22 @@ class Graph:
     def __init__(self, directed: bool = False):
         self.directed = directed
         self.nodes: Dict[any, GraphNode] = {}
+        # Flat adjacency shared by searches; reset whenever the graph changes
+        self._csr_cache: Optional[tuple] = None
+        self._reverse_csr_cache: Optional[tuple] = None
     
     def add_node(self, value) -> GraphNode:
         """Add a node to the graph."""
         if value not in self.nodes:
-            self.nodes[value] = GraphNode(value)
+            self.nodes[value] = GraphNode(value, len(self.nodes))
+            self._invalidate()
         return self.nodes[value]
     
     def add_edge(self, from_value, to_value, weight: float = 1.0):
         """Add an edge between two nodes."""
         from_node = self.add_node(from_value)
         to_node = self.add_node(to_value)
+        self._invalidate()
         
         from_node.add_neighbor(to_node, weight)
         if not self.directed:
@@ -68,23 +100,127 @@ class Graph:
         """Get a node by its value."""
         return self.nodes.get(value)
     
-    def get_all_nodes(self) -> List[GraphNode]:
-        """Return all nodes in the graph."""
-        return list(self.nodes.values())
+    def get_all_nodes(self) -> ValuesView[GraphNode]:
+        """Return a live view of all nodes in the graph (no copy is made)."""
+        return self.nodes.values()
     
     def get_neighbors(self, value) -> List[GraphNode]:
-        """Get neighbors of a node."""
+        """
+        Get neighbors of a node.
+        
+        Returns the node's stored adjacency list without copying; callers
+        must not mutate it.
+        """
+        node = self.nodes.get(value)
+        return node._nbr_nodes if node else []
+    
+    def get_in_neighbors(self, value) -> List[GraphNode]:
+        """
+        Get nodes with an edge into a node.
+        
+        Undirected graphs return the regular neighbors; directed graphs
+        read the cached reverse CSR.
+        """
         node = self.get_node(value)
-        return node.get_neighbors() if node else []
+        if not node:
+            return []
+        if not self.directed:
+            return node.get_neighbors()
+        
+        indptr, indices, _ = self.reverse_csr()
+        id_to_node = self.csr()[3]
+        return [id_to_node[indices[k]] for k in range(indptr[node._id], indptr[node._id + 1])]
     
     def get_edge_weight(self, from_value, to_value) -> float:
-        """Get the weight of an edge."""
-        from_node = self.get_node(from_value)
-        to_node = self.get_node(to_value)
+        """Get the weight of an edge (inf if there is no such edge)."""
+        from_node = self.nodes.get(from_value)
+        to_node = self.nodes.get(to_value)
+        
+        if from_node is None or to_node is None:
+            return INF
+        return from_node.neighbors.get(to_node, INF)
+    
+    def to_csr(self) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Export the adjacency in compressed sparse row (CSR) form.
+        
+        Node ids are the GraphNode._id values (insertion order). The
+        out-edges of node i are indices[indptr[i]:indptr[i + 1]] with the
+        matching entries of weights.
+        
+        Returns:
+            Tuple of (indptr, indices, weights) flat lists
+        """
+        indptr: List[int] = [0]
+        indices: List[int] = []
+        weights: List[float] = []
+        
+        for node in self.nodes.values():
+            indices.extend([neighbor._id for neighbor in node._nbr_nodes])
+            weights.extend(node._nbr_weights)
+            indptr.append(len(indices))
+        
+        return indptr, indices, weights
+    
+    def csr(self) -> Tuple[List[int], List[int], List[float], List[GraphNode], Dict[any, int]]:
+        """
+        Return the cached CSR adjacency, building it on first use.
+        
+        The cache is dropped by add_node/add_edge, so repeated searches on
+        an unchanged graph share one build. Edges added by calling
+        GraphNode.add_neighbor directly bypass the invalidation.
+        
+        Returns:
+            Tuple of (indptr, indices, weights, id_to_node, value_to_id)
+        """
+        if self._csr_cache is None:
+            indptr, indices, weights = self.to_csr()
+            id_to_node = list(self.nodes.values())
+            value_to_id = {node.value: node._id for node in id_to_node}
+            self._csr_cache = (indptr, indices, weights, id_to_node, value_to_id)
+        return self._csr_cache
+    
+    def reverse_csr(self) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Return the cached CSR of incoming edges (predecessors).
+        
+        Undirected graphs share the forward arrays.
+        
+        Returns:
+            Tuple of (indptr, indices, weights) over in-edges
+        """
+        indptr, indices, weights, _, _ = self.csr()
+        if not self.directed:
+            return indptr, indices, weights
         
-        if from_node and to_node:
-            return from_node.get_weight(to_node)
-        return float('inf')
+        if self._reverse_csr_cache is None:
+            num_nodes = len(indptr) - 1
+            
+            # Count in-degrees, then fill each node's slice in source order
+            rev_indptr = [0] * (num_nodes + 1)
+            for target in indices:
+                rev_indptr[target + 1] += 1
+            for i in range(num_nodes):
+                rev_indptr[i + 1] += rev_indptr[i]
+            
+            fill = rev_indptr[:-1]
+            rev_indices = [0] * len(indices)
+            rev_weights = [0.0] * len(indices)
+            for source in range(num_nodes):
+                for k in range(indptr[source], indptr[source + 1]):
+                    target = indices[k]
+                    slot = fill[target]
+                    rev_indices[slot] = source
+                    rev_weights[slot] = weights[k]
+                    fill[target] = slot + 1
+            
+            self._reverse_csr_cache = (rev_indptr, rev_indices, rev_weights)
+        return self._reverse_csr_cache
+    
+    def _invalidate(self):
+        """Drop cached adjacency after a structural change."""
+        self._csr_cache = None
+        self._reverse_csr_cache = None
     
     def __len__(self):
         return len(self.nodes)
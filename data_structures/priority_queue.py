@@ -3,82 +3,88 @@ Custom Priority Queue Implementation
 Min-heap based priority queue for efficient priority-based operations.
 """
 
-from typing import Any, Tuple, List
+import heapq
+from itertools import count
+from typing import Any, Dict, Tuple, List
 
 
 class PriorityQueue:
     """
-    Custom Priority Queue implementation using a binary min-heap.
+    Custom Priority Queue implementation using a binary min-heap (heapq).
     Time Complexity: O(log n) for insert and extract_min operations.
+    
+    Equal priorities are extracted in insertion order; values themselves are
+    never compared.
     """
     
+    __slots__ = ('_heap', '_counter')
+    
     def __init__(self):
-        self._heap: List[Tuple[float, Any]] = []  # (priority, value)
-        self._size = 0
+        # (priority, insertion counter, value); the counter breaks ties
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = count()
     
     def insert(self, value: Any, priority: float):
         """Insert an element with a given priority."""
-        self._heap.append((priority, value))
-        self._size += 1
-        self._heapify_up(self._size - 1)
+        heapq.heappush(self._heap, (priority, next(self._counter), value))
     
     def extract_min(self) -> Tuple[float, Any]:
         """Remove and return the element with minimum priority."""
-        if self.is_empty():
+        if not self._heap:
             raise IndexError("extract_min from empty priority queue")
         
-        min_item = self._heap[0]
+        priority, _, value = heapq.heappop(self._heap)
+        return priority, value
+    
+    def extract_min_lazy(self, best: Dict[Any, float]) -> Tuple[float, Any]:
+        """
+        Remove and return the minimum entry that is still current.
+        
+        Supports decrease-key by lazy deletion: insert the value again with
+        its improved priority, record that priority in best, and entries
+        worse than best[value] are discarded here instead of being searched
+        for and removed. Values missing from best are always current.
+        """
+        heap = self._heap
+        heappop = heapq.heappop
         
-        # Move last element to root and heapify down
-        self._heap[0] = self._heap[self._size - 1]
-        self._heap.pop()
-        self._size -= 1
+        while heap:
+            priority, _, value = heappop(heap)
+            if value not in best or priority <= best[value]:
+                return priority, value
         
-        if not self.is_empty():
-            self._heapify_down(0)
+        raise IndexError("extract_min from empty priority queue")
+    
+    def drain_sorted(self) -> List[Tuple[float, Any]]:
+        """
+        Remove all elements and return them in extraction order.
         
-        return min_item
+        One sort of the heap array replaces n extract_min calls; the
+        insertion counters keep ties in insertion order.
+        """
+        items = [(priority, value) for priority, _, value in sorted(self._heap)]
+        self._heap.clear()
+        return items
     
     def peek_min(self) -> Tuple[float, Any]:
         """Return the element with minimum priority without removing it."""
-        if self.is_empty():
+        if not self._heap:
             raise IndexError("peek_min from empty priority queue")
-        return self._heap[0]
+        
+        priority, _, value = self._heap[0]
+        return priority, value
     
     def is_empty(self) -> bool:
         """Check if the priority queue is empty."""
-        return self._size == 0
+        return not self._heap
     
     def size(self) -> int:
         """Return the number of elements in the priority queue."""
-        return self._size
-    
-    def _heapify_up(self, index: int):
-        """Restore heap property by moving element up."""
-        parent = (index - 1) // 2
-        
-        if index > 0 and self._heap[index][0] < self._heap[parent][0]:
-            self._heap[index], self._heap[parent] = self._heap[parent], self._heap[index]
-            self._heapify_up(parent)
-    
-    def _heapify_down(self, index: int):
-        """Restore heap property by moving element down."""
-        smallest = index
-        left = 2 * index + 1
-        right = 2 * index + 2
-        
-        if left < self._size and self._heap[left][0] < self._heap[smallest][0]:
-            smallest = left
-        
-        if right < self._size and self._heap[right][0] < self._heap[smallest][0]:
-            smallest = right
-        
-        if smallest != index:
-            self._heap[index], self._heap[smallest] = self._heap[smallest], self._heap[index]
-            self._heapify_down(smallest)
+        return len(self._heap)
     
     def __len__(self):
-        return self._size
+        return len(self._heap)
     
     def __repr__(self):
-        return f"PriorityQueue({self._heap})"
+        items = [(priority, value) for priority, _, value in self._heap]
+        return f"PriorityQueue({items})"
@@ -3,73 +3,48 @@ Custom Queue Implementation
 FIFO (First In First Out) data structure.
 """
 
-from typing import Optional, Any
+from collections import deque
+from typing import Any
 
 
 class Queue:
     """
-    Custom Queue implementation using a linked list approach.
+    Custom Queue implementation backed by collections.deque.
     Time Complexity: O(1) for enqueue and dequeue operations.
     """
     
-    class _Node:
-        """Internal node class for the queue."""
-        def __init__(self, value):
-            self.value = value
-            self.next: Optional['Queue._Node'] = None
+    __slots__ = ('_items',)
     
     def __init__(self):
-        self._front: Optional[Queue._Node] = None
-        self._rear: Optional[Queue._Node] = None
-        self._size = 0
+        # Front of the queue is the left end of the deque
+        self._items: deque = deque()
     
     def enqueue(self, value: Any):
         """Add an element to the rear of the queue."""
-        new_node = Queue._Node(value)
-        
-        if self.is_empty():
-            self._front = self._rear = new_node
-        else:
-            self._rear.next = new_node
-            self._rear = new_node
-        
-        self._size += 1
+        self._items.append(value)
     
     def dequeue(self) -> Any:
         """Remove and return the front element."""
-        if self.is_empty():
+        if not self._items:
             raise IndexError("dequeue from empty queue")
-        
-        value = self._front.value
-        self._front = self._front.next
-        
-        if self._front is None:
-            self._rear = None
-        
-        self._size -= 1
-        return value
+        return self._items.popleft()
     
     def peek(self) -> Any:
         """Return the front element without removing it."""
-        if self.is_empty():
+        if not self._items:
             raise IndexError("peek from empty queue")
-        return self._front.value
+        return self._items[0]
     
     def is_empty(self) -> bool:
         """Check if the queue is empty."""
-        return self._front is None
+        return not self._items
     
     def size(self) -> int:
         """Return the number of elements in the queue."""
-        return self._size
+        return len(self._items)
     
     def __len__(self):
-        return self._size
+        return len(self._items)
     
     def __repr__(self):
-        elements = []
-        current = self._front
-        while current:
-            elements.append(str(current.value))
-            current = current.next
-        return f"Queue([{', '.join(elements)}])"
+        return f"Queue([{', '.join(str(value) for value in self._items)}])"
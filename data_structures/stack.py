@@ -3,63 +3,47 @@ Custom Stack Implementation
 LIFO (Last In First Out) data structure.
 """
 
-from typing import Optional, Any
+from typing import Any
 
 
 class Stack:
     """
-    Custom Stack implementation using a linked list approach.
+    Custom Stack implementation backed by a Python list.
     Time Complexity: O(1) for push and pop operations.
     """
     
-    class _Node:
-        """Internal node class for the stack."""
-        def __init__(self, value):
-            self.value = value
-            self.next: Optional['Stack._Node'] = None
+    __slots__ = ('_items',)
     
     def __init__(self):
-        self._top: Optional[Stack._Node] = None
-        self._size = 0
+        # Top of the stack is the end of the list
+        self._items: list = []
     
     def push(self, value: Any):
         """Add an element to the top of the stack."""
-        new_node = Stack._Node(value)
-        new_node.next = self._top
-        self._top = new_node
-        self._size += 1
+        self._items.append(value)
     
     def pop(self) -> Any:
         """Remove and return the top element."""
-        if self.is_empty():
+        if not self._items:
             raise IndexError("pop from empty stack")
-        
-        value = self._top.value
-        self._top = self._top.next
-        self._size -= 1
-        return value
+        return self._items.pop()
     
     def peek(self) -> Any:
         """Return the top element without removing it."""
-        if self.is_empty():
+        if not self._items:
             raise IndexError("peek from empty stack")
-        return self._top.value
+        return self._items[-1]
     
     def is_empty(self) -> bool:
         """Check if the stack is empty."""
-        return self._top is None
+        return not self._items
     
     def size(self) -> int:
         """Return the number of elements in the stack."""
-        return self._size
+        return len(self._items)
     
     def __len__(self):
-        return self._size
+        return len(self._items)
     
     def __repr__(self):
-        elements = []
-        current = self._top
-        while current:
-            elements.append(str(current.value))
-            current = current.next
-        return f"Stack([{', '.join(elements)}])"
+        return f"Stack([{', '.join(str(value) for value in reversed(self._items))}])"
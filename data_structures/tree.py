@@ -9,6 +9,8 @@ from typing import Optional, List, Any
 class TreeNode:
     """Represents a node in a general tree."""
     
+    __slots__ = ('value', 'children', 'parent')
+    
     def __init__(self, value: Any):
         self.value = value
         self.children: List['TreeNode'] = []
@@ -39,6 +41,8 @@ class BinaryTree:
     
     class Node:
         """Binary tree node."""
+        __slots__ = ('value', 'left', 'right', 'parent')
+        
         def __init__(self, value: Any):
             self.value = value
             self.left: Optional['BinaryTree.Node'] = None
@@ -55,36 +59,25 @@ class BinaryTree:
     def insert(self, value: Any) -> 'BinaryTree.Node':
         """Insert a value into the binary tree (level-order insertion)."""
         new_node = BinaryTree.Node(value)
+        self._size += 1
         
         if self.root is None:
             self.root = new_node
-            self._size += 1
             return new_node
         
-        # Level-order insertion using a queue
-        from .queue import Queue
-        queue = Queue()
-        queue.enqueue(self.root)
-        
-        while not queue.is_empty():
-            current = queue.dequeue()
-            
-            if current.left is None:
-                current.left = new_node
-                new_node.parent = current
-                self._size += 1
-                return new_node
-            else:
-                queue.enqueue(current.left)
-            
-            if current.right is None:
-                current.right = new_node
-                new_node.parent = current
-                self._size += 1
-                return new_node
-            else:
-                queue.enqueue(current.right)
+        # The tree is complete, so the new node goes to heap position
+        # _size (1-based). Below the leading 1, the bits of that position
+        # spell the path from the root: 0 is left, 1 is right.
+        position = self._size
+        current = self.root
+        for shift in range(position.bit_length() - 2, 0, -1):
+            current = current.right if (position >> shift) & 1 else current.left
         
+        if position & 1:
+            current.right = new_node
+        else:
+            current.left = new_node
+        new_node.parent = current
         return new_node
     
     def inorder_traversal(self, node: Optional['BinaryTree.Node'] = None) -> List[Any]:
@@ -94,14 +87,20 @@ class BinaryTree:
         return self._inorder_helper(node)
     
     def _inorder_helper(self, node: Optional['BinaryTree.Node']) -> List[Any]:
-        """Helper for inorder traversal."""
-        if node is None:
-            return []
-        
+        """Helper for inorder traversal (explicit stack, single output list)."""
         result = []
-        result.extend(self._inorder_helper(node.left))
-        result.append(node.value)
-        result.extend(self._inorder_helper(node.right))
+        stack = []
+        
+        while stack or node is not None:
+            # Descend to the leftmost unvisited node
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            
+            node = stack.pop()
+            result.append(node.value)
+            node = node.right
+        
         return result
     
     def preorder_traversal(self, node: Optional['BinaryTree.Node'] = None) -> List[Any]:
@@ -111,13 +110,19 @@ class BinaryTree:
         return self._preorder_helper(node)
     
     def _preorder_helper(self, node: Optional['BinaryTree.Node']) -> List[Any]:
-        """Helper for preorder traversal."""
-        if node is None:
-            return []
+        """Helper for preorder traversal (explicit stack, single output list)."""
+        result = []
+        stack = [node] if node is not None else []
+        
+        while stack:
+            node = stack.pop()
+            result.append(node.value)
+            # Push right first so the left subtree is visited first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
         
-        result = [node.value]
-        result.extend(self._preorder_helper(node.left))
-        result.extend(self._preorder_helper(node.right))
         return result
     
     def postorder_traversal(self, node: Optional['BinaryTree.Node'] = None) -> List[Any]:
@@ -127,14 +132,20 @@ class BinaryTree:
         return self._postorder_helper(node)
     
     def _postorder_helper(self, node: Optional['BinaryTree.Node']) -> List[Any]:
-        """Helper for postorder traversal."""
-        if node is None:
-            return []
-        
+        """Helper for postorder traversal (explicit stack, single output list)."""
         result = []
-        result.extend(self._postorder_helper(node.left))
-        result.extend(self._postorder_helper(node.right))
-        result.append(node.value)
+        stack = [node] if node is not None else []
+        
+        # Collect (root, right, left), which is postorder reversed
+        while stack:
+            node = stack.pop()
+            result.append(node.value)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        
+        result.reverse()
         return result
     
     def size(self) -> int:
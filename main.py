@@ -9,6 +9,11 @@ Purpose: Demonstrate discrete structures, algorithm design, and programmatic thi
 import time
 from problems import PathfindingProblem, MazeProblem, SchedulingProblem
 
+# Each benchmark timing is the best of BENCHMARK_REPEAT batches of
+# BENCHMARK_NUMBER runs, reported per run
+BENCHMARK_NUMBER = 5
+BENCHMARK_REPEAT = 3
+
 
 def print_header(title):
     """Print a formatted header."""
@@ -34,8 +39,10 @@ def demonstrate_pathfinding():
     results = problem.compare_algorithms()
     
     print_section("Algorithm Comparison")
-    print(f"{'Algorithm':<20} {'Found':<8} {'Cost':<10} {'Nodes Explored':<15} {'Path Length':<12}")
-    print("-" * 80)
+    lines = [
+        f"{'Algorithm':<20} {'Found':<8} {'Cost':<10} {'Nodes Explored':<15} {'Path Length':<12}",
+        "-" * 80,
+    ]
     
     for algo_name, result in results.items():
         found = "Yes" if result['found'] else "No"
@@ -47,7 +54,9 @@ def demonstrate_pathfinding():
         nodes = result['nodes_explored']
         path_len = len(result['path'])
         
-        print(f"{algo_name:<20} {found:<8} {cost:<10} {nodes:<15} {path_len:<12}")
+        lines.append(f"{algo_name:<20} {found:<8} {cost:<10} {nodes:<15} {path_len:<12}")
+    
+    print("\n".join(lines))
     
     # Show the optimal path
     dijkstra_result = results['Dijkstra']
@@ -67,22 +76,25 @@ def demonstrate_maze_solving():
     
     # Show original maze
     print_section("Original Maze")
-    for row in maze.maze:
-        print(''.join(row))
+    print("\n".join(''.join(row) for row in maze.maze))
     
     # Compare algorithms
     results = maze.compare_algorithms()
     
     print_section("Algorithm Performance")
-    print(f"{'Algorithm':<15} {'Found':<8} {'Path Length':<12} {'Nodes Explored':<15}")
-    print("-" * 60)
+    lines = [
+        f"{'Algorithm':<18} {'Found':<8} {'Path Length':<12} {'Nodes Explored':<15}",
+        "-" * 63,
+    ]
     
     for algo_name, result in results.items():
         found = "Yes" if result['found'] else "No"
         path_len = len(result['path'])
         nodes = result['nodes_explored']
         
-        print(f"{algo_name:<15} {found:<8} {path_len:<12} {nodes:<15}")
+        lines.append(f"{algo_name:<18} {found:<8} {path_len:<12} {nodes:<15}")
+    
+    print("\n".join(lines))
     
     # Visualize BFS solution
     bfs_result = results['BFS']
@@ -102,10 +114,11 @@ def demonstrate_scheduling():
     
     # Show all tasks
     print_section("Project Tasks")
-    print(f"{'Task':<20} {'Duration (hours)':<15}")
-    print("-" * 40)
-    for task_name, task in problem.tasks.items():
-        print(f"{task_name:<20} {task.duration:<15}")
+    lines = [f"{'Task':<20} {'Duration (hours)':<15}", "-" * 40]
+    lines.extend(
+        f"{task_name:<20} {task.duration:<15}" for task_name, task in problem.tasks.items()
+    )
+    print("\n".join(lines))
     
     # Calculate critical path
     result = problem.calculate_critical_path()
@@ -115,23 +128,31 @@ def demonstrate_scheduling():
         return
     
     print_section("Execution Order (Topological Sort)")
-    for i, task_name in enumerate(result['order'], 1):
-        print(f"{i}. {task_name}")
+    print("\n".join(f"{i}. {task_name}" for i, task_name in enumerate(result['order'], 1)))
     
     print_section("Task Schedule")
-    print(f"{'Task':<20} {'Start Time':<15} {'Duration':<10} {'End Time':<10}")
-    print("-" * 60)
+    lines = [f"{'Task':<20} {'Start Time':<15} {'Duration':<10} {'End Time':<10}", "-" * 60]
     
     for task_name in result['order']:
         task = problem.tasks[task_name]
         start = result['earliest_start'][task_name]
         end = start + task.duration
-        print(f"{task_name:<20} {start:<15} {task.duration:<10} {end:<10}")
+        lines.append(f"{task_name:<20} {start:<15} {task.duration:<10} {end:<10}")
+    
+    print("\n".join(lines))
     
     print(f"\nTotal Project Duration: {result['total_duration']} hours")
     print(f"Estimated Days (8h/day): {result['total_duration'] / 8:.1f} days")
 
 
+def _time_batch_ns(func, number):
+    """Return the monotonic nanoseconds taken by calling func number times."""
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        func()
+    return time.perf_counter_ns() - start
+
+
 def run_performance_benchmark():
     """Benchmark algorithm performance."""
     print_header("PERFORMANCE BENCHMARK")
@@ -148,19 +169,26 @@ def run_performance_benchmark():
     }
     
     print_section("Execution Time Comparison")
-    print(f"{'Algorithm':<15} {'Time (ms)':<12} {'Nodes Explored':<15} {'Path Length':<12}")
-    print("-" * 60)
+    lines = [
+        f"{'Algorithm':<18} {'Time (ms)':<12} {'Nodes Explored':<15} {'Path Length':<12}",
+        "-" * 63,
+    ]
     
     for algo_name, solve_func in algorithms.items():
-        start_time = time.time()
         result = solve_func()
-        end_time = time.time()
         
-        elapsed_ms = (end_time - start_time) * 1000
+        # The minimum over batches is the least noisy estimate
+        best_ns = min(
+            _time_batch_ns(solve_func, BENCHMARK_NUMBER) for _ in range(BENCHMARK_REPEAT)
+        )
+        elapsed_ms = best_ns / BENCHMARK_NUMBER / 1e6
         nodes = result['nodes_explored']
         path_len = len(result['path']) if result['found'] else 0
         
-        print(f"{algo_name:<15} {elapsed_ms:<12.3f} {nodes:<15} {path_len:<12}")
+        lines.append(f"{algo_name:<18} {elapsed_ms:<12.3f} {nodes:<15} {path_len:<12}")
+    
+    # Written after timing so console output never lands inside a batch
+    print("\n".join(lines))
 
 
 def show_complexity_analysis():
@@ -174,11 +202,12 @@ def show_complexity_analysis():
         ("A*", "O((V + E) log V)", "O(V)", "Optimal with admissible heuristic"),
     ]
     
-    print(f"\n{'Algorithm':<12} {'Time':<20} {'Space':<10} {'Use Case':<40}")
-    print("-" * 85)
-    
-    for algo, time_comp, space_comp, use_case in complexities:
-        print(f"{algo:<12} {time_comp:<20} {space_comp:<10} {use_case:<40}")
+    lines = [f"\n{'Algorithm':<12} {'Time':<20} {'Space':<10} {'Use Case':<40}", "-" * 85]
+    lines.extend(
+        f"{algo:<12} {time_comp:<20} {space_comp:<10} {use_case:<40}"
+        for algo, time_comp, space_comp, use_case in complexities
+    )
+    print("\n".join(lines))
     
     print("\nWhere:")
     print("  V = Number of vertices (nodes)")
@@ -3,10 +3,37 @@ Maze Problem
 Pathfinding in a 2D grid maze.
 """
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 from data_structures import Graph
-from algorithms import bfs_path, dfs_path, dijkstra, astar
-from algorithms.astar import manhattan_distance
+from .maze_kernels import (
+    walkable_grid, grid_csr, bfs_grid, dfs_grid, dijkstra_grid, astar_grid,
+    bidirectional_astar_grid
+)
+
+# Layouts of the sample mazes; every create_* call builds its own grid from them
+_SAMPLE_MAZE = (
+    'S.#...#...',
+    '..#.#.#.#.',
+    '.#..#...#.',
+    '.#.####.#.',
+    '........#.',
+    '####.####.',
+    '..........',
+    '.########.',
+    '.........G',
+)
+
+_COMPLEX_MAZE = (
+    '..#.........#..',
+    '.##.###.###.#.#',
+    '..........#....',
+    '##.######.####.',
+    '...#...........',
+    '.###.##########',
+    '...............',
+    '######.#######.',
+    '...............',
+)
 
 
 class MazeProblem:
@@ -21,52 +48,137 @@ class MazeProblem:
         self.cols = len(maze[0]) if maze else 0
         self.start = start
         self.goal = goal
-        self.graph = self._build_graph()
+        # Flat walkable flags (r * cols + c) and the open-neighbor CSR built
+        # from them once; every solver searches this shared adjacency
+        self._grid = walkable_grid(maze)
+        self._indptr, self._neighbors = grid_csr(self._grid, self.rows, self.cols)
+        self._graph: Optional[Graph] = None
+        # compare_algorithms results keyed by (start, goal); the grid and
+        # its adjacency are fixed at construction, so they never go stale
+        self._comparisons: Dict[Tuple[Tuple[int, int], Tuple[int, int]], Dict] = {}
+    
+    @property
+    def graph(self) -> Graph:
+        """Graph form of the maze, built on first access."""
+        if self._graph is None:
+            self._graph = self._build_graph()
+        return self._graph
     
     def _build_graph(self) -> Graph:
         """Convert the maze into a graph representation."""
         graph = Graph(directed=False)
+        add_edge = graph.add_edge
+        
+        # Each row as a bitmask of open columns (bit c set if (r, c) is open)
+        masks = [
+            sum(1 << c for c, cell in enumerate(row) if cell != '#')
+            for row in self.maze
+        ]
         
-        # Add edges for adjacent walkable cells
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.maze[r][c] == '#':
-                    continue
-                
-                current = (r, c)
-                
-                # Check all 4 directions (up, down, left, right)
-                directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-                for dr, dc in directions:
-                    nr, nc = r + dr, c + dc
-                    
-                    if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                        if self.maze[nr][nc] != '#':
-                            neighbor = (nr, nc)
-                            graph.add_edge(current, neighbor, 1.0)
+        for r, mask in enumerate(masks):
+            # Open cells whose lower / right neighbor is open too
+            down = mask & masks[r + 1] if r + 1 < self.rows else 0
+            right = mask & (mask >> 1)
+            
+            # Per cell, add the down edge before the right one so that every
+            # node lists its neighbors up, left, down, right
+            edges = down | right
+            while edges:
+                low = edges & -edges
+                c = low.bit_length() - 1
+                if down & low:
+                    add_edge((r, c), (r + 1, c), 1.0)
+                if right & low:
+                    add_edge((r, c), (r, c + 1), 1.0)
+                edges ^= low
         
         return graph
     
+    def _run_kernel(self, kernel) -> Tuple[bool, List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """
+        Run a grid kernel from start to goal.
+        
+        Returns:
+            (found, path, visited) with cells as (row, col) tuples
+        """
+        def is_open(cell: Tuple[int, int]) -> bool:
+            r, c = cell
+            return 0 <= r < self.rows and 0 <= c < self.cols and self.maze[r][c] != '#'
+        
+        if not is_open(self.start) or not is_open(self.goal):
+            return False, [], []
+        
+        cols = self.cols
+        start = self.start[0] * cols + self.start[1]
+        goal = self.goal[0] * cols + self.goal[1]
+        found, parent, visited = kernel(self._indptr, self._neighbors, cols, start, goal)
+        
+        visited_cells = [divmod(idx, cols) for idx in visited]
+        if not found:
+            return False, [], visited_cells
+        
+        # Reconstruct path
+        path = []
+        idx = goal
+        while idx != -1:
+            path.append(divmod(idx, cols))
+            idx = parent[idx]
+        path.reverse()
+        
+        return True, path, visited_cells
+    
     def solve_bfs(self) -> Dict:
-        """Solve maze using BFS."""
-        from algorithms.bfs import breadth_first_search
-        return breadth_first_search(self.graph, self.start, self.goal)
+        """Solve maze using BFS on the grid kernel."""
+        found, path, visited = self._run_kernel(bfs_grid)
+        return {
+            'found': found,
+            'path': path,
+            'visited': visited,
+            'nodes_explored': len(visited)
+        }
     
     def solve_dfs(self) -> Dict:
-        """Solve maze using DFS."""
-        from algorithms.dfs import depth_first_search
-        return depth_first_search(self.graph, self.start, self.goal)
+        """Solve maze using DFS on the grid kernel."""
+        found, path, visited = self._run_kernel(dfs_grid)
+        return {
+            'found': found,
+            'path': path,
+            'visited': visited,
+            'nodes_explored': len(visited)
+        }
     
     def solve_dijkstra(self) -> Dict:
-        """Solve maze using Dijkstra's algorithm."""
-        return dijkstra(self.graph, self.start, self.goal)
+        """Solve maze using Dijkstra's algorithm on the grid kernel."""
+        found, path, visited = self._run_kernel(dijkstra_grid)
+        return {
+            'found': found,
+            'path': path,
+            'cost': float(len(path) - 1) if found else float('inf'),
+            'visited': visited,
+            'nodes_explored': len(visited)
+        }
     
     def solve_astar(self) -> Dict:
-        """Solve maze using A* with Manhattan distance heuristic."""
-        def heuristic(pos1, pos2):
-            return manhattan_distance(pos1, pos2)
-        
-        return astar(self.graph, self.start, self.goal, heuristic)
+        """Solve maze using A* with Manhattan distance heuristic on the grid kernel."""
+        found, path, visited = self._run_kernel(astar_grid)
+        return {
+            'found': found,
+            'path': path,
+            'cost': float(len(path) - 1) if found else float('inf'),
+            'visited': visited,
+            'nodes_explored': len(visited)
+        }
+    
+    def solve_astar_bidirectional(self) -> Dict:
+        """Solve maze using bidirectional A* with Manhattan potentials on the grid kernel."""
+        found, path, visited = self._run_kernel(bidirectional_astar_grid)
+        return {
+            'found': found,
+            'path': path,
+            'cost': float(len(path) - 1) if found else float('inf'),
+            'visited': visited,
+            'nodes_explored': len(visited)
+        }
     
     def visualize_solution(self, path: List[Tuple[int, int]]) -> str:
         """
@@ -78,44 +190,48 @@ class MazeProblem:
         Returns:
             String representation of the maze with path marked
         """
-        # Create a copy of the maze
-        visual = [row[:] for row in self.maze]
+        # Share the unmarked rows; a row is copied the first time it is marked
+        visual = list(self.maze)
         
         # Mark the path
         for r, c in path:
+            row = visual[r]
+            if row is self.maze[r]:
+                row = visual[r] = row[:]
+            
             if (r, c) == self.start:
-                visual[r][c] = 'S'
+                row[c] = 'S'
             elif (r, c) == self.goal:
-                visual[r][c] = 'G'
+                row[c] = 'G'
             else:
-                visual[r][c] = '*'
+                row[c] = '*'
         
         # Convert to string
         return '\n'.join([''.join(row) for row in visual])
     
     def compare_algorithms(self) -> Dict:
-        """Compare all pathfinding algorithms on this maze."""
-        return {
-            'BFS': self.solve_bfs(),
-            'DFS': self.solve_dfs(),
-            'Dijkstra': self.solve_dijkstra(),
-            'A*': self.solve_astar()
-        }
+        """
+        Compare all pathfinding algorithms on this maze.
+        
+        The result is cached per (start, goal) pair and shared between
+        calls, so it must not be modified.
+        """
+        key = (self.start, self.goal)
+        results = self._comparisons.get(key)
+        if results is None:
+            results = self._comparisons[key] = {
+                'BFS': self.solve_bfs(),
+                'DFS': self.solve_dfs(),
+                'Dijkstra': self.solve_dijkstra(),
+                'A*': self.solve_astar(),
+                'Bidirectional A*': self.solve_astar_bidirectional()
+            }
+        return results
     
     @staticmethod
     def create_sample_maze() -> 'MazeProblem':
         """Create a sample maze problem."""
-        maze = [
-            ['S', '.', '#', '.', '.', '.', '#', '.', '.', '.'],
-            ['.', '.', '#', '.', '#', '.', '#', '.', '#', '.'],
-            ['.', '#', '.', '.', '#', '.', '.', '.', '#', '.'],
-            ['.', '#', '.', '#', '#', '#', '#', '.', '#', '.'],
-            ['.', '.', '.', '.', '.', '.', '.', '.', '#', '.'],
-            ['#', '#', '#', '#', '.', '#', '#', '#', '#', '.'],
-            ['.', '.', '.', '.', '.', '.', '.', '.', '.', '.'],
-            ['.', '#', '#', '#', '#', '#', '#', '#', '#', '.'],
-            ['.', '.', '.', '.', '.', '.', '.', '.', '.', 'G'],
-        ]
+        maze = [list(row) for row in _SAMPLE_MAZE]
         
         start = (0, 0)
         goal = (8, 9)
@@ -125,17 +241,7 @@ class MazeProblem:
     @staticmethod
     def create_complex_maze() -> 'MazeProblem':
         """Create a more complex maze problem."""
-        maze = [
-            ['.', '.', '#', '.', '.', '.', '.', '.', '.', '.', '.', '.', '#', '.', '.'],
-            ['.', '#', '#', '.', '#', '#', '#', '.', '#', '#', '#', '.', '#', '.', '#'],
-            ['.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '#', '.', '.', '.', '.'],
-            ['#', '#', '.', '#', '#', '#', '#', '#', '#', '.', '#', '#', '#', '#', '.'],
-            ['.', '.', '.', '#', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.'],
-            ['.', '#', '#', '#', '.', '#', '#', '#', '#', '#', '#', '#', '#', '#', '#'],
-            ['.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.'],
-            ['#', '#', '#', '#', '#', '#', '.', '#', '#', '#', '#', '#', '#', '#', '.'],
-            ['.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.', '.'],
-        ]
+        maze = [list(row) for row in _COMPLEX_MAZE]
         
         start = (0, 0)
         goal = (8, 14)
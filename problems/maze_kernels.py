@@ -0,0 +1,345 @@
+"""
+Maze Grid Kernels
+Search kernels specialised for 4-connected mazes with unit step costs.
+
+Cells are addressed by flat indices r * cols + c. The open neighbors of
+every cell are computed once into a CSR pair (indptr, indices) that all
+kernels share, and per-cell search state lives in flat lists indexed the
+same way. Kernels return raw flat indices; MazeProblem turns them into
+(row, col) results.
+"""
+
+import heapq
+from typing import List, Tuple
+
+INF = float('inf')
+
+
+def walkable_grid(maze: List[List[str]]) -> bytearray:
+    """Flatten a maze into a bytearray with 1 for open cells, 0 for walls."""
+    return bytearray(cell != '#' for row in maze for cell in row)
+
+
+def grid_csr(walkable: bytearray, rows: int, cols: int) -> Tuple[List[int], List[int]]:
+    """
+    Build the open-neighbor adjacency of every cell in CSR form.
+    
+    Returns:
+        (indptr, indices) where indices[indptr[i]:indptr[i + 1]] are the open
+        neighbors of cell i in up, left, down, right order (empty for walls),
+        the order MazeProblem.graph lists them in
+    """
+    num_cells = rows * cols
+    indptr = [0] * (num_cells + 1)
+    indices: List[int] = []
+    append = indices.append
+    last_col = cols - 1
+    
+    current = 0
+    for r in range(rows):
+        # Row bounds are fixed for the whole row; column bounds per cell
+        has_up = r > 0
+        has_down = r < rows - 1
+        
+        # The four directions are unrolled: up, left, down, right
+        for c in range(cols):
+            if walkable[current]:
+                if has_up and walkable[current - cols]:
+                    append(current - cols)
+                if c > 0 and walkable[current - 1]:
+                    append(current - 1)
+                if has_down and walkable[current + cols]:
+                    append(current + cols)
+                if c < last_col and walkable[current + 1]:
+                    append(current + 1)
+            
+            current += 1
+            indptr[current] = len(indices)
+    
+    return indptr, indices
+
+
+def bfs_grid(indptr: List[int], indices: List[int], cols: int,
+             start: int, goal: int) -> Tuple[bool, List[int], List[int]]:
+    """
+    Breadth-first search between two flat cell indices.
+    
+    Unit step costs need no queue discipline beyond levels, so the search
+    expands one whole frontier at a time. As in algorithms.bfs, it stops
+    when the goal itself is expanded, so visited holds every cell
+    discovered up to that point.
+    
+    Returns:
+        (found, parent, visited) where parent maps each reached cell to its
+        predecessor (-1 for none) and visited lists cells in discovery order
+    """
+    num_cells = len(indptr) - 1
+    parent: List[int] = [-1] * num_cells
+    seen = bytearray(num_cells)
+    seen[start] = 1
+    visited_order = [start]
+    frontier = [start]
+    
+    while frontier:
+        next_frontier: List[int] = []
+        push = next_frontier.append
+        
+        for current in frontier:
+            if current == goal:
+                visited_order.extend(next_frontier)
+                return True, parent, visited_order
+            
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    parent[neighbor] = current
+                    push(neighbor)
+        
+        visited_order.extend(next_frontier)
+        frontier = next_frontier
+    
+    return False, parent, visited_order
+
+
+def dfs_grid(indptr: List[int], indices: List[int], cols: int,
+             start: int, goal: int) -> Tuple[bool, List[int], List[int]]:
+    """
+    Depth-first search between two flat cell indices.
+    
+    Neighbors are explored up, left, down, right; a cell's parent is the
+    first cell that pushed it, as in algorithms.dfs.
+    
+    Returns:
+        (found, parent, visited) where parent maps each reached cell to its
+        predecessor (-1 for none) and visited lists cells in visit order
+    """
+    num_cells = len(indptr) - 1
+    parent: List[int] = [-1] * num_cells
+    seen = bytearray(num_cells)
+    visited_order = []
+    stack = [start]
+    
+    while stack:
+        current = stack.pop()
+        
+        if seen[current]:
+            continue
+        
+        seen[current] = 1
+        visited_order.append(current)
+        
+        if current == goal:
+            return True, parent, visited_order
+        
+        # Pushed in reverse so that up is popped first
+        for neighbor in reversed(indices[indptr[current]:indptr[current + 1]]):
+            if not seen[neighbor]:
+                if parent[neighbor] == -1:
+                    parent[neighbor] = current
+                stack.append(neighbor)
+    
+    return False, parent, visited_order
+
+
+def dijkstra_grid(indptr: List[int], indices: List[int], cols: int,
+                  start: int, goal: int) -> Tuple[bool, List[int], List[int]]:
+    """
+    Dijkstra's algorithm between two flat cell indices (unit step costs).
+    
+    Returns:
+        (found, parent, visited) where parent maps each reached cell to its
+        predecessor (-1 for none) and visited lists cells in settle order
+    """
+    num_cells = len(indptr) - 1
+    distance: List[float] = [INF] * num_cells
+    distance[start] = 0
+    parent: List[int] = [-1] * num_cells
+    visited_order = []
+    
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    # Priority queue: (distance, cell index)
+    pq = [(0, start)]
+    
+    while pq:
+        current_dist, current = heappop(pq)
+        
+        # Lazy decrease-key: skip entries superseded by a shorter distance
+        if current_dist > distance[current]:
+            continue
+        
+        visited_order.append(current)
+        
+        if current == goal:
+            return True, parent, visited_order
+        
+        new_distance = current_dist + 1
+        
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if new_distance < distance[neighbor]:
+                distance[neighbor] = new_distance
+                parent[neighbor] = current
+                heappush(pq, (new_distance, neighbor))
+    
+    return False, parent, visited_order
+
+
+def astar_grid(indptr: List[int], indices: List[int], cols: int,
+               start: int, goal: int) -> Tuple[bool, List[int], List[int]]:
+    """
+    A* search between two flat cell indices with the Manhattan heuristic.
+    
+    Returns:
+        (found, parent, visited) where parent maps each reached cell to its
+        predecessor (-1 for none) and visited lists cells in expansion order
+    """
+    num_cells = len(indptr) - 1
+    goal_r, goal_c = divmod(goal, cols)
+    
+    g_score: List[float] = [INF] * num_cells
+    g_score[start] = 0
+    parent: List[int] = [-1] * num_cells
+    visited_order = []
+    
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    start_r, start_c = divmod(start, cols)
+    # Priority queue: (f_score, cell index, g_score)
+    pq = [(abs(start_r - goal_r) + abs(start_c - goal_c), start, 0)]
+    
+    while pq:
+        _, current, g_current = heappop(pq)
+        
+        # Lazy decrease-key: entries superseded by a better score are stale
+        if g_current > g_score[current]:
+            continue
+        
+        visited_order.append(current)
+        
+        if current == goal:
+            return True, parent, visited_order
+        
+        g_next = g_current + 1
+        
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if g_next < g_score[neighbor]:
+                g_score[neighbor] = g_next
+                parent[neighbor] = current
+                nr, nc = divmod(neighbor, cols)
+                f = g_next + abs(nr - goal_r) + abs(nc - goal_c)
+                heappush(pq, (f, neighbor, g_next))
+    
+    return False, parent, visited_order
+
+
+def bidirectional_astar_grid(indptr: List[int], indices: List[int], cols: int,
+                             start: int, goal: int) -> Tuple[bool, List[int], List[int]]:
+    """
+    Bidirectional A* between two flat cell indices with Manhattan potentials.
+    
+    Mirrors algorithms.bidirectional_astar: forward and backward searches
+    keyed by the average potential, stopping once top_f + top_b reaches the
+    best meeting cost. Maze moves are symmetric, so both directions share
+    the same adjacency.
+    
+    Returns:
+        (found, parent, visited) where following parent from goal yields the
+        path back to start and visited lists newly expanded cells in order
+    """
+    num_cells = len(indptr) - 1
+    
+    if start == goal:
+        return True, [-1] * num_cells, [start]
+    
+    start_r, start_c = divmod(start, cols)
+    goal_r, goal_c = divmod(goal, cols)
+    
+    def potential(cell: int) -> float:
+        r, c = divmod(cell, cols)
+        return ((abs(r - goal_r) + abs(c - goal_c))
+                - (abs(r - start_r) + abs(c - start_c))) / 2
+    
+    g_forward: List[float] = [INF] * num_cells
+    g_backward: List[float] = [INF] * num_cells
+    parent_forward: List[int] = [-1] * num_cells
+    parent_backward: List[int] = [-1] * num_cells
+    closed_forward = bytearray(num_cells)
+    closed_backward = bytearray(num_cells)
+    visited_order = []
+    
+    g_forward[start] = 0
+    g_backward[goal] = 0
+    
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    # Priority queues: (key, cell index)
+    pq_forward = [(potential(start), start)]
+    pq_backward = [(-potential(goal), goal)]
+    
+    best_cost = INF
+    meeting = -1
+    
+    while pq_forward and pq_backward:
+        top_forward = pq_forward[0][0]
+        top_backward = pq_backward[0][0]
+        
+        # No unexplored path can beat the best meeting found so far
+        if top_forward + top_backward >= best_cost:
+            break
+        
+        # Expand whichever frontier has the smaller key
+        if top_forward <= top_backward:
+            pq, g_this, g_other = pq_forward, g_forward, g_backward
+            top_other = top_backward
+            parent, closed, closed_other = parent_forward, closed_forward, closed_backward
+            sign = 1
+        else:
+            pq, g_this, g_other = pq_backward, g_backward, g_forward
+            top_other = top_forward
+            parent, closed, closed_other = parent_backward, closed_backward, closed_forward
+            sign = -1
+        
+        _, current = heappop(pq)
+        
+        if closed[current]:
+            continue
+        
+        closed[current] = 1
+        if not closed_other[current]:
+            visited_order.append(current)
+        
+        g_next = g_this[current] + 1
+        
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            if closed[neighbor]:
+                continue
+            
+            if g_next < g_this[neighbor]:
+                g_this[neighbor] = g_next
+                parent[neighbor] = current
+                
+                # Both searches have reached this cell: candidate meeting point
+                total = g_next + g_other[neighbor]
+                if total < best_cost:
+                    best_cost = total
+                    meeting = neighbor
+                
+                key = g_next + sign * potential(neighbor)
+                if key + top_other >= best_cost:
+                    continue
+                
+                heappush(pq, (key, neighbor))
+    
+    if meeting == -1:
+        return False, parent_forward, visited_order
+    
+    # Splice the backward half onto the forward parents: walking from the
+    # meeting cell towards the goal, point each cell back at its predecessor
+    previous = meeting
+    cell = parent_backward[meeting]
+    while cell != -1:
+        parent_forward[cell] = previous
+        previous = cell
+        cell = parent_backward[cell]
+    
+    return True, parent_forward, visited_order
@@ -3,41 +3,225 @@ Pathfinding Problem
 General pathfinding on weighted graphs.
 """
 
-from typing import Dict, List, Tuple
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 from data_structures import Graph
-from algorithms import bfs_path, dfs_path, dijkstra, astar
-from algorithms.astar import euclidean_distance, manhattan_distance
+from algorithms import bfs_path, dfs_path, dijkstra, astar, bidirectional_astar
+from algorithms import direction_optimizing_bfs, depth_first_search
+from algorithms.heuristics import (
+    bind_heuristic, euclidean_distance, manhattan_distance, zero_heuristic
+)
+
+# Distance functions selectable by PathfindingProblem's heuristic_type
+HEURISTICS = {
+    'euclidean': euclidean_distance,
+    'manhattan': manhattan_distance,
+}
+
+# Roads between cities (city1, city2, distance) for create_city_map
+_CITY_ROADS = (
+    ('London', 'Paris', 344),
+    ('London', 'Amsterdam', 358),
+    ('Paris', 'Amsterdam', 431),
+    ('Paris', 'Berlin', 878),
+    ('Amsterdam', 'Berlin', 576),
+    ('Berlin', 'Prague', 280),
+    ('Paris', 'Madrid', 1054),
+    ('Madrid', 'Barcelona', 504),
+    ('Barcelona', 'Paris', 831),
+    ('Berlin', 'Vienna', 524),
+    ('Prague', 'Vienna', 251),
+)
+
+# Approximate positions (for heuristic)
+_CITY_POSITIONS = (
+    ('London', (0, 51)),
+    ('Paris', (2, 48)),
+    ('Amsterdam', (4, 52)),
+    ('Berlin', (13, 52)),
+    ('Prague', (14, 50)),
+    ('Vienna', (16, 48)),
+    ('Madrid', (-3, 40)),
+    ('Barcelona', (2, 41)),
+)
+
+
+class _NodePositions(MutableMapping):
+    """
+    Node positions of a PathfindingProblem.
+    
+    Behaves like a dict; every change calls on_change so the problem can
+    drop results and distances computed from the old positions.
+    """
+    
+    def __init__(self, positions: Dict, on_change: Callable[[], None]):
+        self._positions = positions
+        self._on_change = on_change
+    
+    def __getitem__(self, node_value):
+        return self._positions[node_value]
+    
+    def __setitem__(self, node_value, position):
+        self._positions[node_value] = position
+        self._on_change()
+    
+    def __delitem__(self, node_value):
+        del self._positions[node_value]
+        self._on_change()
+    
+    def __iter__(self) -> Iterator:
+        return iter(self._positions)
+    
+    def __len__(self):
+        return len(self._positions)
+    
+    def __repr__(self):
+        return repr(self._positions)
+
+
+def _copy_result(result: Dict) -> Dict:
+    """Copy a result dict together with its lists and nested result dicts."""
+    copied = {}
+    for key, value in result.items():
+        if isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = _copy_result(value)
+        copied[key] = value
+    return copied
 
 
 class PathfindingProblem:
     """
     Represents a general pathfinding problem on a graph.
     Can be solved with BFS, DFS, Dijkstra, or A*.
+    
+    Solver and comparison results are cached until the graph or a node
+    position changes; every call returns a fresh copy that the caller may
+    modify freely.
     """
     
     def __init__(self, graph: Graph, start, goal):
         self.graph = graph
         self.start = start
         self.goal = goal
-        self.node_positions: Dict = {}  # For heuristic calculations
+        # For heuristic calculations; changes invalidate the caches below
+        self._positions: Dict = {}
+        self.node_positions: MutableMapping = _NodePositions(self._positions, self._clear_caches)
+        # Solver results keyed by (solver, start, goal[, heuristic]), each
+        # stored with the graph CSR it was computed on
+        self._results: Dict[tuple, Tuple[tuple, Dict]] = {}
+        # Lazily filled distance table: (heuristic_type, target) -> {node: distance}
+        self._distance_rows: Dict[tuple, Dict[Any, float]] = {}
     
     def set_node_position(self, node_value, position: Tuple[float, float]):
         """Set the 2D position of a node for heuristic calculations."""
         self.node_positions[node_value] = position
     
+    def _clear_caches(self):
+        """Drop cached results and distances after a position change."""
+        self._results.clear()
+        self._distance_rows.clear()
+    
+    def _cached(self, key: tuple, solve: Callable[[], Dict]) -> Dict:
+        """
+        Return the cached result for key, running solve on a miss.
+        
+        Graph.csr() returns the same tuple until the graph changes, so an
+        entry is reused only while its CSR is still the graph's current one.
+        Callers get a copy, so changing it never reaches the cache.
+        """
+        csr = self.graph.csr()
+        entry = self._results.get(key)
+        if entry is None or entry[0] is not csr:
+            entry = self._results[key] = (csr, solve())
+        return _copy_result(entry[1])
+    
     def solve_bfs(self) -> Dict:
-        """Solve using Breadth-First Search."""
-        from algorithms.bfs import breadth_first_search
-        return breadth_first_search(self.graph, self.start, self.goal)
+        """Solve using direction-optimizing Breadth-First Search."""
+        return self._cached(
+            ('bfs', self.start, self.goal),
+            lambda: direction_optimizing_bfs(self.graph, self.start, self.goal)
+        )
     
     def solve_dfs(self) -> Dict:
         """Solve using Depth-First Search."""
-        from algorithms.dfs import depth_first_search
-        return depth_first_search(self.graph, self.start, self.goal)
+        return self._cached(
+            ('dfs', self.start, self.goal),
+            lambda: depth_first_search(self.graph, self.start, self.goal)
+        )
     
     def solve_dijkstra(self) -> Dict:
         """Solve using Dijkstra's algorithm."""
-        return dijkstra(self.graph, self.start, self.goal)
+        return self._cached(
+            ('dijkstra', self.start, self.goal),
+            lambda: dijkstra(self.graph, self.start, self.goal)
+        )
+    
+    def _heuristic(self, heuristic_type: str) -> Callable[[Any, Any], float]:
+        """
+        Build a heuristic between any two positioned nodes.
+        
+        Distances are read from and added to the problem's distance table,
+        so they are computed at most once per pair across searches.
+        
+        Args:
+            heuristic_type: 'euclidean', 'manhattan', or 'zero'
+        """
+        distance = HEURISTICS.get(heuristic_type)
+        if distance is None:
+            return zero_heuristic
+        
+        def heuristic(node1, node2, _positions=self._positions, _distance=distance,
+                      _rows=self._distance_rows, _type=heuristic_type):
+            row = _rows.get((_type, node2))
+            if row is None:
+                row = _rows[(_type, node2)] = {}
+            
+            estimate = row.get(node1)
+            if estimate is None:
+                pos1 = _positions.get(node1)
+                pos2 = _positions.get(node2)
+                if pos1 is None or pos2 is None:
+                    estimate = 0.0
+                else:
+                    # Same closure _goal_heuristic uses, so shared rows agree
+                    estimate = bind_heuristic(_distance, pos2)(pos1)
+                row[node1] = estimate
+            return estimate
+        
+        return heuristic
+    
+    def _goal_heuristic(self, heuristic_type: str) -> Callable[[Any, Any], float]:
+        """
+        Build a heuristic specialised for self.goal.
+        
+        The distance function and goal position are resolved once, and each
+        node's estimate is memoized in the goal's row of the distance table,
+        so re-relaxed nodes and later searches cost a single dict lookup.
+        The second argument is ignored.
+        
+        Args:
+            heuristic_type: 'euclidean', 'manhattan', or 'zero'
+        """
+        distance = HEURISTICS.get(heuristic_type)
+        goal_pos = self._positions.get(self.goal)
+        if distance is None or goal_pos is None:
+            return zero_heuristic
+        
+        to_goal = bind_heuristic(distance, goal_pos)
+        estimates = self._distance_rows.setdefault((heuristic_type, self.goal), {})
+        
+        def heuristic(node, _goal, _positions=self._positions, _to_goal=to_goal,
+                      _estimates=estimates):
+            estimate = _estimates.get(node)
+            if estimate is None:
+                pos = _positions.get(node)
+                estimate = 0.0 if pos is None else _to_goal(pos)
+                _estimates[node] = estimate
+            return estimate
+        
+        return heuristic
     
     def solve_astar(self, heuristic_type: str = 'euclidean') -> Dict:
         """
@@ -46,39 +230,63 @@ class PathfindingProblem:
         Args:
             heuristic_type: 'euclidean', 'manhattan', or 'zero'
         """
-        def heuristic(node1, node2):
-            if node1 not in self.node_positions or node2 not in self.node_positions:
-                return 0.0
-            
-            pos1 = self.node_positions[node1]
-            pos2 = self.node_positions[node2]
-            
-            if heuristic_type == 'euclidean':
-                return euclidean_distance(pos1, pos2)
-            elif heuristic_type == 'manhattan':
-                return manhattan_distance(pos1, pos2)
-            else:
-                return 0.0
+        return self._cached(
+            ('astar', self.start, self.goal, heuristic_type),
+            lambda: astar(self.graph, self.start, self.goal,
+                          self._goal_heuristic(heuristic_type))
+        )
+    
+    def solve_astar_bidirectional(self, heuristic_type: str = 'euclidean') -> Dict:
+        """
+        Solve using bidirectional A* (meets in the middle).
         
-        return astar(self.graph, self.start, self.goal, heuristic)
+        The backward search measures towards the start, so this uses the
+        general two-node heuristic.
+        
+        Args:
+            heuristic_type: 'euclidean', 'manhattan', or 'zero'
+        """
+        return self._cached(
+            ('bidirectional_astar', self.start, self.goal, heuristic_type),
+            lambda: bidirectional_astar(self.graph, self.start, self.goal,
+                                        self._heuristic(heuristic_type))
+        )
     
-    def compare_algorithms(self) -> Dict:
+    def compare_algorithms(self, fast_compare: bool = False) -> Dict:
         """
         Run all algorithms and compare their performance.
         
+        Args:
+            fast_compare: Skip Dijkstra and rely on the Euclidean A* entry for
+                          the optimal path. A* with an admissible heuristic
+                          finds the same cost, so a second shortest-path
+                          search adds nothing. Ignored when no node positions
+                          are set.
+        
         Returns:
-            Dictionary with results from each algorithm
+            Dictionary with results from each algorithm; cached like the
+            individual solver results, and returned as a fresh copy
         """
+        return self._cached(
+            ('compare', self.start, self.goal, fast_compare),
+            lambda: self._compare_algorithms(fast_compare)
+        )
+    
+    def _compare_algorithms(self, fast_compare: bool) -> Dict:
+        """Run every solver for compare_algorithms."""
         results = {
             'BFS': self.solve_bfs(),
             'DFS': self.solve_dfs(),
-            'Dijkstra': self.solve_dijkstra(),
         }
         
+        if not (fast_compare and self.node_positions):
+            results['Dijkstra'] = self.solve_dijkstra()
+        
         # Only run A* if positions are set
         if self.node_positions:
             results['A* (Euclidean)'] = self.solve_astar('euclidean')
             results['A* (Manhattan)'] = self.solve_astar('manhattan')
+            results['Bidirectional A*'] = self.solve_astar_bidirectional('euclidean')
         
         return results
     
@@ -91,39 +299,12 @@ class PathfindingProblem:
         """
         graph = Graph(directed=False)
         
-        # Add edges (roads between cities)
-        edges = [
-            ('London', 'Paris', 344),
-            ('London', 'Amsterdam', 358),
-            ('Paris', 'Amsterdam', 431),
-            ('Paris', 'Berlin', 878),
-            ('Amsterdam', 'Berlin', 576),
-            ('Berlin', 'Prague', 280),
-            ('Paris', 'Madrid', 1054),
-            ('Madrid', 'Barcelona', 504),
-            ('Barcelona', 'Paris', 831),
-            ('Berlin', 'Vienna', 524),
-            ('Prague', 'Vienna', 251),
-        ]
-        
-        for city1, city2, distance in edges:
+        for city1, city2, distance in _CITY_ROADS:
             graph.add_edge(city1, city2, distance)
         
         problem = PathfindingProblem(graph, 'London', 'Vienna')
         
-        # Set approximate positions (for heuristic)
-        positions = {
-            'London': (0, 51),
-            'Paris': (2, 48),
-            'Amsterdam': (4, 52),
-            'Berlin': (13, 52),
-            'Prague': (14, 50),
-            'Vienna': (16, 48),
-            'Madrid': (-3, 40),
-            'Barcelona': (2, 41),
-        }
-        
-        for city, pos in positions.items():
+        for city, pos in _CITY_POSITIONS:
             problem.set_node_position(city, pos)
         
         return problem
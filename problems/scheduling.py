@@ -3,21 +3,59 @@ Scheduling Problem
 Task scheduling with dependencies using topological sorting.
 """
 
-from typing import List, Dict, Set, Optional
-from data_structures import Graph, Queue
+from collections import deque
+from typing import List, Dict, Set, Optional, Tuple
+from data_structures import Graph
 
 
 class Task:
-    """Represents a task with duration and dependencies."""
+    """
+    Represents a task with duration and dependencies.
+    
+    Once added to a SchedulingProblem, the task is a view onto the problem's
+    arrays: its duration is read from and written to them, and
+    add_dependency forwards to SchedulingProblem.add_dependency.
+    """
+    
+    __slots__ = ('_name', '_duration', '_problem', '_id')
     
     def __init__(self, name: str, duration: int):
-        self.name = name
-        self.duration = duration
-        self.dependencies: List['Task'] = []
+        self._name = name
+        self._duration = duration
+        # Set by SchedulingProblem.add_task
+        self._problem: Optional['SchedulingProblem'] = None
+        self._id = -1
+    
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @property
+    def duration(self) -> int:
+        if self._problem is None:
+            return self._duration
+        return self._problem._durations[self._id]
+    
+    @duration.setter
+    def duration(self, value: int):
+        if self._problem is None:
+            self._duration = value
+        else:
+            self._problem._durations[self._id] = value
+    
+    @property
+    def dependencies(self) -> List['Task']:
+        """Tasks that must be completed before this one."""
+        problem = self._problem
+        if problem is None:
+            return []
+        return [problem._task_list[u] for u in problem._preds[self._id]]
     
     def add_dependency(self, task: 'Task'):
         """Add a task that must be completed before this one."""
-        self.dependencies.append(task)
+        if self._problem is None:
+            raise ValueError("Task must be added to a SchedulingProblem first")
+        self._problem.add_dependency(self.name, task.name)
     
     def __repr__(self):
         return f"Task({self.name}, {self.duration}h)"
@@ -31,14 +69,52 @@ class SchedulingProblem:
     
     def __init__(self):
         self.tasks: Dict[str, Task] = {}
-        self.graph = Graph(directed=True)
+        
+        # Struct-of-arrays view of the tasks; ids follow insertion order
+        self._task_list: List[Task] = []
+        self._names: List[str] = []
+        self._durations: List[int] = []
+        self._ids: Dict[str, int] = {}
+        # Dependency edges as parallel id lists: _dep_task[k] waits on _dep_on[k]
+        self._dep_task: List[int] = []
+        self._dep_on: List[int] = []
+        self._dep_edges: Set[Tuple[int, int]] = set()
+        # Prerequisite ids of every task, in insertion order
+        self._preds: List[List[int]] = []
+        self._in_degree: List[int] = []
+        self._succ_csr: Optional[Tuple[List[int], List[int]]] = None
+        self._graph: Optional[Graph] = None
+    
+    @property
+    def graph(self) -> Graph:
+        """
+        Dependency graph (dependency -> dependent), built from the task
+        arrays on first access after a change.
+        """
+        if self._graph is None:
+            graph = Graph(directed=True)
+            for name in self._names:
+                graph.add_node(name)
+            for u, t in zip(self._dep_on, self._dep_task):
+                graph.add_edge(self._names[u], self._names[t])
+            self._graph = graph
+        return self._graph
     
     def add_task(self, name: str, duration: int) -> Task:
         """Add a task to the scheduling problem."""
         if name not in self.tasks:
             task = Task(name, duration)
+            task._problem = self
+            task._id = len(self._names)
             self.tasks[name] = task
-            self.graph.add_node(name)
+            
+            self._ids[name] = task._id
+            self._task_list.append(task)
+            self._names.append(name)
+            self._durations.append(duration)
+            self._preds.append([])
+            self._in_degree.append(0)
+            self._invalidate()
         return self.tasks[name]
     
     def add_dependency(self, task_name: str, depends_on: str):
@@ -49,49 +125,108 @@ class SchedulingProblem:
         if task_name not in self.tasks or depends_on not in self.tasks:
             raise ValueError("Both tasks must exist")
         
-        self.tasks[task_name].add_dependency(self.tasks[depends_on])
-        # Edge from dependency to dependent (depends_on -> task_name)
-        self.graph.add_edge(depends_on, task_name)
+        # Keep a single edge per (dependency, dependent) pair
+        edge = (self._ids[depends_on], self._ids[task_name])
+        if edge not in self._dep_edges:
+            self._dep_edges.add(edge)
+            self._dep_on.append(edge[0])
+            self._dep_task.append(edge[1])
+            self._preds[edge[1]].append(edge[0])
+            self._in_degree[edge[1]] += 1
+            self._invalidate()
     
-    def topological_sort(self) -> Optional[List[str]]:
+    def _invalidate(self):
+        """Drop the successor CSR and graph built from the arrays."""
+        self._succ_csr = None
+        self._graph = None
+    
+    def _successor_csr(self) -> Tuple[List[int], List[int]]:
         """
-        Perform topological sort using Kahn's algorithm.
+        Return the dependents of every task in CSR form, cached until the
+        next add_task/add_dependency.
         
         Returns:
-            List of task names in valid execution order, or None if cycle detected
+            (indptr, indices) where indices[indptr[t]:indptr[t + 1]] are the
+            ids of the tasks that wait on task id t, in insertion order
         """
-        # Calculate in-degree for each node
-        in_degree: Dict[str, int] = {name: 0 for name in self.tasks}
+        if self._succ_csr is None:
+            num_tasks = len(self._names)
+            indptr = [0] * (num_tasks + 1)
+            for u in self._dep_on:
+                indptr[u + 1] += 1
+            for u in range(num_tasks):
+                indptr[u + 1] += indptr[u]
+            
+            indices = [0] * len(self._dep_on)
+            fill = indptr[:-1]
+            for u, t in zip(self._dep_on, self._dep_task):
+                indices[fill[u]] = t
+                fill[u] += 1
+            
+            self._succ_csr = (indptr, indices)
+        return self._succ_csr
+    
+    def _kahn_with_est(self) -> Tuple[Optional[List[int]], List[int], int]:
+        """
+        Kahn's algorithm fused with the earliest-start computation.
         
-        for task_name in self.tasks:
-            neighbors = self.graph.get_neighbors(task_name)
-            for neighbor in neighbors:
-                in_degree[neighbor.value] += 1
+        Each task's finish time is pushed to its dependents as the task is
+        dequeued, so one pass over the edges yields all three results.
         
-        # Queue of tasks with no dependencies
-        queue = Queue()
-        for task_name, degree in in_degree.items():
-            if degree == 0:
-                queue.enqueue(task_name)
+        Returns:
+            (order, earliest, total_duration) where order lists task ids in
+            execution order (None if a cycle was detected), earliest[t] is
+            the earliest start time of task id t and total_duration is the
+            latest finish time
+        """
+        indptr, indices = self._successor_csr()
+        durations = self._durations
+        num_tasks = len(durations)
+        
+        # Kept up to date by add_dependency; the pass consumes a copy
+        in_degree = self._in_degree.copy()
         
-        result = []
+        earliest: List[int] = [0] * num_tasks
+        
+        # Queue of tasks with no dependencies
+        queue = deque(t for t in range(num_tasks) if in_degree[t] == 0)
+        order: List[int] = []
+        total_duration = 0
         
-        while not queue.is_empty():
-            current = queue.dequeue()
-            result.append(current)
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            finish = earliest[current] + durations[current]
+            if finish > total_duration:
+                total_duration = finish
             
-            # Reduce in-degree of neighbors
-            neighbors = self.graph.get_neighbors(current)
-            for neighbor in neighbors:
-                in_degree[neighbor.value] -= 1
-                if in_degree[neighbor.value] == 0:
-                    queue.enqueue(neighbor.value)
+            # Dependents cannot start before this task ends
+            for t in indices[indptr[current]:indptr[current + 1]]:
+                if finish > earliest[t]:
+                    earliest[t] = finish
+                in_degree[t] -= 1
+                if in_degree[t] == 0:
+                    queue.append(t)
         
         # Check if all tasks were processed (no cycle)
-        if len(result) != len(self.tasks):
+        if len(order) != num_tasks:
+            return None, earliest, total_duration
+        
+        return order, earliest, total_duration
+    
+    def topological_sort(self) -> Optional[List[str]]:
+        """
+        Perform topological sort using Kahn's algorithm.
+        
+        Returns:
+            List of task names in valid execution order, or None if cycle detected
+        """
+        order, _, _ = self._kahn_with_est()
+        
+        if order is None:
             return None  # Cycle detected
         
-        return result
+        return [self._names[t] for t in order]
     
     def calculate_critical_path(self) -> Dict:
         """
@@ -104,7 +239,7 @@ class SchedulingProblem:
             - 'total_duration': Minimum project completion time
             - 'critical_path': Tasks on the critical path
         """
-        order = self.topological_sort()
+        order, earliest, total_duration = self._kahn_with_est()
         
         if order is None:
             return {
@@ -115,27 +250,9 @@ class SchedulingProblem:
                 'critical_path': None
             }
         
-        # Calculate earliest start times
-        earliest_start: Dict[str, int] = {name: 0 for name in self.tasks}
-        
-        for task_name in order:
-            task = self.tasks[task_name]
-            
-            # Earliest start is max(end time of all dependencies)
-            for dep in task.dependencies:
-                dep_end = earliest_start[dep.name] + dep.duration
-                earliest_start[task_name] = max(earliest_start[task_name], dep_end)
-        
-        # Calculate total project duration
-        total_duration = 0
-        for task_name in self.tasks:
-            task = self.tasks[task_name]
-            end_time = earliest_start[task_name] + task.duration
-            total_duration = max(total_duration, end_time)
-        
         return {
-            'order': order,
-            'earliest_start': earliest_start,
+            'order': [self._names[t] for t in order],
+            'earliest_start': dict(zip(self._names, earliest)),
             'total_duration': total_duration,
             'error': None
         }
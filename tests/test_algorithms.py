@@ -3,6 +3,7 @@ Test Suite for Algorithms
 Tests all pathfinding algorithms for correctness and performance.
 """
 
+import importlib
 import unittest
 import sys
 import os
@@ -12,22 +13,52 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from data_structures import Graph
 from algorithms import breadth_first_search, depth_first_search, dijkstra, astar
+from algorithms import bidirectional_astar, dijkstra_grid, parallel_bfs
+from algorithms import direction_optimizing_bfs
 from algorithms.astar import manhattan_distance
 
+# The package re-exports the function under the module's name
+parallel_bfs_module = importlib.import_module('algorithms.parallel_bfs')
+
+
+def build_graph(edges) -> Graph:
+    """
+    Build an undirected graph from (src, dst) or (src, dst, weight) tuples.
+    
+    Test classes share one graph per class; tests that mutate it build
+    their own copy with this helper.
+    """
+    graph = Graph()
+    for edge in edges:
+        graph.add_edge(*edge)
+    return graph
+
+
+def grid_edges(size: int) -> list:
+    """Unit-weight edges of a size x size 4-connected grid of (row, col) cells."""
+    edges = []
+    for r in range(size):
+        for c in range(size):
+            if c + 1 < size:
+                edges.append(((r, c), (r, c + 1), 1.0))
+            if r + 1 < size:
+                edges.append(((r, c), (r + 1, c), 1.0))
+    return edges
+
 
 class TestBFS(unittest.TestCase):
     """Test cases for Breadth-First Search."""
     
-    def setUp(self):
+    EDGES = [
+        ('A', 'B'), ('A', 'C'),
+        ('B', 'D'), ('C', 'D'),
+        ('D', 'E')
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
         """Create a simple graph for testing."""
-        self.graph = Graph()
-        edges = [
-            ('A', 'B'), ('A', 'C'),
-            ('B', 'D'), ('C', 'D'),
-            ('D', 'E')
-        ]
-        for src, dst in edges:
-            self.graph.add_edge(src, dst)
+        cls.graph = build_graph(cls.EDGES)
     
     def test_path_found(self):
         result = breadth_first_search(self.graph, 'A', 'E')
@@ -36,8 +67,9 @@ class TestBFS(unittest.TestCase):
         self.assertEqual(result['path'][-1], 'E')
     
     def test_path_not_found(self):
-        self.graph.add_node('Z')
-        result = breadth_first_search(self.graph, 'A', 'Z')
+        graph = build_graph(self.EDGES)
+        graph.add_node('Z')
+        result = breadth_first_search(graph, 'A', 'Z')
         self.assertFalse(result['found'])
         self.assertEqual(result['path'], [])
     
@@ -48,19 +80,75 @@ class TestBFS(unittest.TestCase):
         self.assertEqual(len(result['path']), 3)  # A -> B/C -> D
 
 
+class TestParallelBFS(unittest.TestCase):
+    """Test cases for level-synchronous parallel BFS."""
+    
+    EDGES = grid_edges(20)
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create a grid large enough to have several frontier levels."""
+        cls.graph = build_graph(cls.EDGES)
+    
+    def test_matches_sequential_bfs(self):
+        # Force every level through the thread pool
+        original = parallel_bfs_module.PARALLEL_FRONTIER_THRESHOLD
+        parallel_bfs_module.PARALLEL_FRONTIER_THRESHOLD = 1
+        try:
+            result = parallel_bfs(self.graph, (0, 0), (19, 19), max_workers=4)
+        finally:
+            parallel_bfs_module.PARALLEL_FRONTIER_THRESHOLD = original
+        
+        expected = breadth_first_search(self.graph, (0, 0), (19, 19))
+        self.assertTrue(result['found'])
+        self.assertEqual(result['path'], expected['path'])
+    
+    def test_path_not_found(self):
+        graph = build_graph(self.EDGES)
+        graph.add_node('Z')
+        result = parallel_bfs(graph, (0, 0), 'Z')
+        self.assertFalse(result['found'])
+        self.assertEqual(result['nodes_explored'], 400)
+
+
+class TestDirectionOptimizingBFS(unittest.TestCase):
+    """Test cases for direction-optimizing BFS."""
+    
+    def test_bottom_up_matches_top_down_length(self):
+        # A star graph: the second level holds nearly every node
+        graph = Graph(directed=True)
+        for leaf in range(1, 50):
+            graph.add_edge(0, leaf)
+            graph.add_edge(leaf, 50)
+        
+        result = direction_optimizing_bfs(graph, 0, 50, alpha=1)
+        expected = breadth_first_search(graph, 0, 50)
+        self.assertTrue(result['found'])
+        self.assertEqual(len(result['path']), len(expected['path']))
+        self.assertEqual(result['nodes_explored'], 51)
+    
+    def test_path_not_found(self):
+        graph = Graph()
+        graph.add_edge('A', 'B')
+        graph.add_node('Z')
+        result = direction_optimizing_bfs(graph, 'A', 'Z')
+        self.assertFalse(result['found'])
+        self.assertEqual(result['path'], [])
+
+
 class TestDFS(unittest.TestCase):
     """Test cases for Depth-First Search."""
     
-    def setUp(self):
+    EDGES = [
+        ('A', 'B'), ('A', 'C'),
+        ('B', 'D'), ('C', 'E'),
+        ('D', 'F'), ('E', 'F')
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
         """Create a simple graph for testing."""
-        self.graph = Graph()
-        edges = [
-            ('A', 'B'), ('A', 'C'),
-            ('B', 'D'), ('C', 'E'),
-            ('D', 'F'), ('E', 'F')
-        ]
-        for src, dst in edges:
-            self.graph.add_edge(src, dst)
+        cls.graph = build_graph(cls.EDGES)
     
     def test_path_found(self):
         result = depth_first_search(self.graph, 'A', 'F')
@@ -69,24 +157,25 @@ class TestDFS(unittest.TestCase):
         self.assertEqual(result['path'][-1], 'F')
     
     def test_path_not_found(self):
-        self.graph.add_node('Z')
-        result = depth_first_search(self.graph, 'A', 'Z')
+        graph = build_graph(self.EDGES)
+        graph.add_node('Z')
+        result = depth_first_search(graph, 'A', 'Z')
         self.assertFalse(result['found'])
 
 
 class TestDijkstra(unittest.TestCase):
     """Test cases for Dijkstra's Algorithm."""
     
-    def setUp(self):
+    EDGES = [
+        ('A', 'B', 4), ('A', 'C', 2),
+        ('B', 'D', 5), ('C', 'D', 1),
+        ('D', 'E', 3)
+    ]
+    
+    @classmethod
+    def setUpClass(cls):
         """Create a weighted graph for testing."""
-        self.graph = Graph()
-        edges = [
-            ('A', 'B', 4), ('A', 'C', 2),
-            ('B', 'D', 5), ('C', 'D', 1),
-            ('D', 'E', 3)
-        ]
-        for src, dst, weight in edges:
-            self.graph.add_edge(src, dst, weight)
+        cls.graph = build_graph(cls.EDGES)
     
     def test_shortest_path(self):
         result = dijkstra(self.graph, 'A', 'E')
@@ -97,18 +186,46 @@ class TestDijkstra(unittest.TestCase):
     
     def test_direct_path_not_shortest(self):
         # Add a longer direct path
-        self.graph.add_edge('A', 'E', 20)
-        result = dijkstra(self.graph, 'A', 'E')
+        graph = build_graph(self.EDGES)
+        graph.add_edge('A', 'E', 20)
+        result = dijkstra(graph, 'A', 'E')
         # Should still choose the shorter multi-hop path
         self.assertEqual(result['cost'], 6.0)
 
 
+class TestDijkstraGrid(unittest.TestCase):
+    """Test cases for grid-specialised Dijkstra."""
+    
+    def test_avoids_expensive_cells(self):
+        cost = [
+            [1, 9, 1],
+            [1, 9, 1],
+            [1, 1, 1]
+        ]
+        result = dijkstra_grid(cost, (0, 0), (0, 2))
+        self.assertTrue(result['found'])
+        # Detour around the middle column: 6 steps of cost 1
+        self.assertEqual(result['cost'], 6)
+        self.assertEqual(result['path'][0], (0, 0))
+        self.assertEqual(result['path'][-1], (0, 2))
+    
+    def test_walls_block_path(self):
+        cost = [
+            [1, None, 1],
+            [1, None, 1]
+        ]
+        result = dijkstra_grid(cost, (0, 0), (1, 2))
+        self.assertFalse(result['found'])
+        self.assertEqual(result['path'], [])
+
+
 class TestAStar(unittest.TestCase):
     """Test cases for A* Algorithm."""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Create a grid-like graph with positions."""
-        self.graph = Graph()
+        cls.graph = Graph()
         
         # Create a 3x3 grid
         positions = {
@@ -117,15 +234,15 @@ class TestAStar(unittest.TestCase):
             (2, 0): (2, 0), (2, 1): (2, 1), (2, 2): (2, 2)
         }
         
-        self.positions = positions
+        cls.positions = positions
         
         # Add horizontal and vertical connections
         for r in range(3):
             for c in range(3):
                 if c < 2:
-                    self.graph.add_edge((r, c), (r, c+1), 1.0)
+                    cls.graph.add_edge((r, c), (r, c+1), 1.0)
                 if r < 2:
-                    self.graph.add_edge((r, c), (r+1, c), 1.0)
+                    cls.graph.add_edge((r, c), (r+1, c), 1.0)
     
     def test_optimal_path(self):
         def heuristic(pos1, pos2):
@@ -147,21 +264,80 @@ class TestAStar(unittest.TestCase):
         # A* should explore same or fewer nodes
         self.assertLessEqual(astar_result['nodes_explored'], 
                            dijkstra_result['nodes_explored'])
+    
+    def test_positions_with_extra_coordinates(self):
+        # The distance heuristics read only the first two coordinates
+        graph = build_graph([((0, 0, 'a'), (0, 1, 'b'), 1.0), ((0, 1, 'b'), (1, 1, 'c'), 1.0)])
+        result = astar(graph, (0, 0, 'a'), (1, 1, 'c'), manhattan_distance)
+        self.assertTrue(result['found'])
+        self.assertEqual(result['cost'], 2.0)
+
+
+class TestBidirectionalAStar(unittest.TestCase):
+    """Test cases for Bidirectional A* Algorithm."""
+    
+    EDGES = grid_edges(5)
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create a 5x5 grid graph."""
+        cls.graph = build_graph(cls.EDGES)
+    
+    def test_matches_astar_cost(self):
+        result = bidirectional_astar(self.graph, (0, 0), (4, 4), manhattan_distance)
+        expected = astar(self.graph, (0, 0), (4, 4), manhattan_distance)
+        
+        self.assertTrue(result['found'])
+        self.assertEqual(result['cost'], expected['cost'])
+        self.assertEqual(result['path'][0], (0, 0))
+        self.assertEqual(result['path'][-1], (4, 4))
+        self.assertEqual(len(result['path']), 9)
+    
+    def test_directed_graph(self):
+        graph = Graph(directed=True)
+        edges = [
+            ('A', 'B', 1), ('B', 'C', 1), ('C', 'D', 1),
+            ('A', 'D', 10), ('D', 'A', 1)
+        ]
+        for src, dst, weight in edges:
+            graph.add_edge(src, dst, weight)
+        
+        def heuristic(node1, node2):
+            return 0.0
+        
+        result = bidirectional_astar(graph, 'A', 'D', heuristic)
+        self.assertEqual(result['path'], ['A', 'B', 'C', 'D'])
+        self.assertEqual(result['cost'], 3)
+        self.assertEqual([n.value for n in graph.get_in_neighbors('D')], ['A', 'C'])
+    
+    def test_path_not_found(self):
+        graph = build_graph(self.EDGES)
+        graph.add_node('Z')
+        result = bidirectional_astar(graph, (0, 0), 'Z', lambda a, b: 0.0)
+        self.assertFalse(result['found'])
+        self.assertEqual(result['path'], [])
+    
+    def test_start_is_goal(self):
+        result = bidirectional_astar(self.graph, (2, 2), (2, 2), manhattan_distance)
+        self.assertTrue(result['found'])
+        self.assertEqual(result['path'], [(2, 2)])
+        self.assertEqual(result['cost'], 0)
 
 
 class TestAlgorithmComparison(unittest.TestCase):
     """Compare different algorithms on the same problem."""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Create a complex graph."""
-        self.graph = Graph()
+        cls.graph = Graph()
         edges = [
             ('A', 'B', 1), ('A', 'C', 4),
             ('B', 'C', 2), ('B', 'D', 5),
             ('C', 'D', 1), ('D', 'E', 3)
         ]
         for src, dst, weight in edges:
-            self.graph.add_edge(src, dst, weight)
+            cls.graph.add_edge(src, dst, weight)
     
     def test_all_find_path(self):
         """All algorithms should find a path if one exists."""
@@ -3,6 +3,7 @@ Test Suite for Data Structures
 Tests all custom data structures for correctness.
 """
 
+import copy
 import unittest
 import sys
 import os
@@ -47,6 +48,51 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(len(neighbors), 2)
         self.assertIn('B', neighbor_values)
         self.assertIn('C', neighbor_values)
+    
+    def test_readd_edge_updates_weight(self):
+        graph = Graph()
+        graph.add_edge('A', 'B', 5.0)
+        graph.add_edge('A', 'B', 2.0)
+        
+        self.assertEqual(len(graph.get_neighbors('A')), 1)
+        self.assertEqual(graph.get_edge_weight('A', 'B'), 2.0)
+        neighbors = list(graph.get_node('A').iter_neighbors_with_weights())
+        self.assertEqual([(n.value, w) for n, w in neighbors], [('B', 2.0)])
+    
+    def test_edge_weight_matches_node_weight(self):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 5.0)
+        node_a = graph.get_node('A')
+        node_c = graph.add_node('C')
+        node_a.add_neighbor(node_c, 7.0)
+        
+        self.assertEqual(graph.get_edge_weight('A', 'C'), node_a.get_weight(node_c))
+        self.assertEqual(graph.get_edge_weight('A', 'C'), 7.0)
+    
+    def test_to_csr(self):
+        graph = Graph(directed=True)
+        graph.add_edge('A', 'B', 1.0)
+        graph.add_edge('A', 'C', 2.0)
+        graph.add_edge('C', 'B', 3.0)
+        
+        indptr, indices, weights = graph.to_csr()
+        
+        # Node ids follow insertion order: A=0, B=1, C=2
+        self.assertEqual(indptr, [0, 2, 2, 3])
+        self.assertEqual(indices, [1, 2, 1])
+        self.assertEqual(weights, [1.0, 2.0, 3.0])
+    
+    def test_csr_cache_invalidation(self):
+        graph = Graph()
+        graph.add_edge('A', 'B')
+        first = graph.csr()
+        self.assertIs(graph.csr(), first)  # Reused while unchanged
+        
+        graph.add_edge('B', 'C')
+        indptr, indices, _, id_to_node, value_to_id = graph.csr()
+        self.assertEqual(len(id_to_node), 3)
+        self.assertEqual(value_to_id['C'], 2)
+        self.assertEqual(indptr[-1], len(indices))
 
 
 class TestQueue(unittest.TestCase):
@@ -87,6 +133,15 @@ class TestQueue(unittest.TestCase):
         queue.enqueue(1)
         queue.enqueue(2)
         self.assertEqual(queue.size(), 2)
+    
+    def test_deepcopy_is_independent(self):
+        queue = Queue()
+        queue.enqueue(1)
+        clone = copy.deepcopy(queue)
+        clone.enqueue(2)
+        
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(len(clone), 2)
 
 
 class TestStack(unittest.TestCase):
@@ -119,6 +174,15 @@ class TestStack(unittest.TestCase):
         
         self.assertEqual(stack.peek(), 2)
         self.assertEqual(len(stack), 2)  # Peek doesn't remove
+    
+    def test_deepcopy_is_independent(self):
+        stack = Stack()
+        stack.push(1)
+        clone = copy.deepcopy(stack)
+        clone.push(2)
+        
+        self.assertEqual(len(stack), 1)
+        self.assertEqual(len(clone), 2)
 
 
 class TestPriorityQueue(unittest.TestCase):
@@ -151,6 +215,40 @@ class TestPriorityQueue(unittest.TestCase):
             extracted.append(priority)
         
         self.assertEqual(extracted, sorted(values))
+    
+    def test_drain_sorted(self):
+        pq = PriorityQueue()
+        values = [10, 5, 15, 3, 8, 20, 1]
+        
+        for i, val in enumerate(values):
+            pq.insert(f'item{i}', val)
+        
+        extracted = [priority for priority, _ in pq.drain_sorted()]
+        self.assertEqual(extracted, sorted(values))
+        self.assertTrue(pq.is_empty())
+    
+    def test_extract_min_lazy_skips_stale_entries(self):
+        pq = PriorityQueue()
+        best = {'a': 5, 'b': 3}
+        pq.insert('a', 5)
+        pq.insert('b', 3)
+        
+        # Decrease-key: reinsert 'a' and record its new best priority
+        best['a'] = 1
+        pq.insert('a', 1)
+        
+        self.assertEqual(pq.extract_min_lazy(best), (1, 'a'))
+        self.assertEqual(pq.extract_min_lazy(best), (3, 'b'))
+        with self.assertRaises(IndexError):
+            pq.extract_min_lazy(best)  # Only the stale ('a', 5) remains
+    
+    def test_equal_priorities_keep_insertion_order(self):
+        pq = PriorityQueue()
+        # Dicts are not orderable, so ties must never compare the values
+        for i in range(3):
+            pq.insert({'id': i}, 1)
+        
+        self.assertEqual([pq.extract_min()[1]['id'] for _ in range(3)], [0, 1, 2])
 
 
 class TestBinaryTree(unittest.TestCase):
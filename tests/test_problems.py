@@ -10,14 +10,16 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from data_structures import Graph
 from problems import PathfindingProblem, MazeProblem, SchedulingProblem
 
 
 class TestPathfindingProblem(unittest.TestCase):
     """Test cases for PathfindingProblem."""
     
-    def setUp(self):
-        self.problem = PathfindingProblem.create_city_map()
+    @classmethod
+    def setUpClass(cls):
+        cls.problem = PathfindingProblem.create_city_map()
     
     def test_bfs_solution(self):
         result = self.problem.solve_bfs()
@@ -36,6 +38,44 @@ class TestPathfindingProblem(unittest.TestCase):
         self.assertTrue(result['found'])
         self.assertIsInstance(result['cost'], (int, float))
     
+    def test_bidirectional_astar_solution(self):
+        result = self.problem.solve_astar_bidirectional('euclidean')
+        self.assertTrue(result['found'])
+        self.assertEqual(result['cost'], self.problem.solve_dijkstra()['cost'])
+    
+    def test_results_cached_until_graph_changes(self):
+        first = self.problem.solve_dijkstra()
+        first['path'].append('Nowhere')
+        self.assertNotIn('Nowhere', self.problem.solve_dijkstra()['path'])
+        
+        problem = PathfindingProblem(Graph(), 'A', 'C')
+        problem.graph.add_edge('A', 'B', 1)
+        problem.graph.add_edge('B', 'C', 1)
+        self.assertEqual(problem.solve_dijkstra()['cost'], 2)
+        
+        problem.graph.add_edge('A', 'C', 1)
+        self.assertEqual(problem.solve_dijkstra()['cost'], 1)
+    
+    def test_city_map_is_independent(self):
+        other = PathfindingProblem.create_city_map()
+        other.graph.add_edge('London', 'Vienna', 1)
+        self.assertEqual(other.solve_dijkstra()['cost'], 1)
+        
+        fresh = PathfindingProblem.create_city_map()
+        self.assertEqual(fresh.solve_dijkstra()['cost'], self.problem.solve_dijkstra()['cost'])
+        self.assertGreater(fresh.solve_dijkstra()['cost'], 1)
+    
+    def test_position_edits_invalidate_results(self):
+        problem = PathfindingProblem.create_city_map()
+        problem.compare_algorithms()
+        problem.node_positions['Vienna'] = (100, 100)
+        
+        expected = PathfindingProblem.create_city_map()
+        expected.set_node_position('Vienna', (100, 100))
+        after = problem.compare_algorithms()['A* (Euclidean)']
+        self.assertEqual(after['visited'], expected.solve_astar('euclidean')['visited'])
+        self.assertEqual(after['cost'], problem.solve_dijkstra()['cost'])
+    
     def test_algorithm_comparison(self):
         results = self.problem.compare_algorithms()
         
@@ -47,28 +87,59 @@ class TestPathfindingProblem(unittest.TestCase):
         dijkstra_cost = results['Dijkstra']['cost']
         astar_cost = results['A* (Euclidean)']['cost']
         self.assertEqual(dijkstra_cost, astar_cost)
+    
+    def test_fast_compare_skips_dijkstra(self):
+        fast = self.problem.compare_algorithms(fast_compare=True)
+        self.assertNotIn('Dijkstra', fast)
+        self.assertEqual(fast['A* (Euclidean)']['cost'], self.problem.solve_dijkstra()['cost'])
 
 
 class TestMazeProblem(unittest.TestCase):
     """Test cases for MazeProblem."""
     
-    def setUp(self):
-        self.maze = MazeProblem.create_sample_maze()
+    @classmethod
+    def setUpClass(cls):
+        cls.maze = MazeProblem.create_sample_maze()
     
     def test_maze_creation(self):
         self.assertEqual(self.maze.rows, 9)
         self.assertEqual(self.maze.cols, 10)
     
+    def test_sample_maze_is_independent(self):
+        other = MazeProblem.create_sample_maze()
+        other.maze[0][1] = '#'
+        other.goal = (0, 1)
+        
+        fresh = MazeProblem.create_sample_maze()
+        self.assertEqual(fresh.maze[0][1], '.')
+        self.assertEqual(fresh.goal, (8, 9))
+        self.assertEqual(fresh.solve_bfs()['path'], self.maze.solve_bfs()['path'])
+    
     def test_bfs_solves_maze(self):
         result = self.maze.solve_bfs()
         self.assertTrue(result['found'])
         self.assertGreater(len(result['path']), 0)
     
+    def test_search_order_matches_graph_order(self):
+        # Neighbors are expanded up, left, down, right and BFS stops when
+        # the goal is dequeued, as with the graph-based searches
+        bfs = self.maze.solve_bfs()
+        dfs = self.maze.solve_dfs()
+        self.assertEqual((len(bfs['path']), bfs['nodes_explored']), (18, 50))
+        self.assertEqual((len(dfs['path']), dfs['nodes_explored']), (48, 55))
+    
     def test_astar_solves_maze(self):
         result = self.maze.solve_astar()
         self.assertTrue(result['found'])
         self.assertGreater(len(result['path']), 0)
     
+    def test_bidirectional_astar_solves_maze(self):
+        result = self.maze.solve_astar_bidirectional()
+        self.assertTrue(result['found'])
+        self.assertEqual(result['path'][0], self.maze.start)
+        self.assertEqual(result['path'][-1], self.maze.goal)
+        self.assertEqual(len(result['path']), len(self.maze.solve_bfs()['path']))
+    
     def test_visualization(self):
         result = self.maze.solve_bfs()
         if result['found']:
@@ -77,6 +148,14 @@ class TestMazeProblem(unittest.TestCase):
             self.assertIn('G', visual)  # Goal marker
             self.assertIn('*', visual)  # Path marker
     
+    def test_visualization_keeps_cells_and_checks_bounds(self):
+        maze = MazeProblem([['.', '█'], ['.', '.']], (0, 0), (1, 1))
+        self.assertEqual(maze.visualize_solution([(0, 0), (1, 0), (1, 1)]), 'S█\n*G')
+        self.assertEqual(maze.maze[1], ['.', '.'])  # The maze itself is untouched
+        
+        with self.assertRaises(IndexError):
+            maze.visualize_solution([(0, 2)])
+    
     def test_algorithm_comparison(self):
         results = self.maze.compare_algorithms()
         
@@ -88,19 +167,41 @@ class TestMazeProblem(unittest.TestCase):
         bfs_length = len(results['BFS']['path'])
         dijkstra_length = len(results['Dijkstra']['path'])
         self.assertEqual(bfs_length, dijkstra_length)
+    
+    def test_comparison_cached_per_endpoints(self):
+        results = self.maze.compare_algorithms()
+        self.assertIs(self.maze.compare_algorithms(), results)
+        
+        maze = MazeProblem.create_sample_maze()
+        maze.goal = (6, 0)
+        self.assertEqual(maze.compare_algorithms()['BFS']['path'][-1], (6, 0))
 
 
 class TestSchedulingProblem(unittest.TestCase):
     """Test cases for SchedulingProblem."""
     
-    def setUp(self):
-        self.problem = SchedulingProblem.create_software_project()
+    @classmethod
+    def setUpClass(cls):
+        cls.problem = SchedulingProblem.create_software_project()
     
     def test_task_creation(self):
         self.assertEqual(len(self.problem.tasks), 8)
         self.assertIn('Requirements', self.problem.tasks)
         self.assertIn('Deployment', self.problem.tasks)
     
+    def test_task_changes_reach_the_schedule(self):
+        problem = SchedulingProblem.create_software_project()
+        testing = problem.tasks['Testing']
+        self.assertEqual([dep.name for dep in testing.dependencies], ['Backend', 'Frontend'])
+        
+        testing.duration = 100
+        self.assertEqual(problem.calculate_critical_path()['total_duration'], 168)
+        
+        problem.tasks['Documentation'].add_dependency(problem.tasks['Deployment'])
+        self.assertEqual(problem.calculate_critical_path()['total_duration'], 172)
+        self.assertIn('Documentation',
+                      [n.value for n in problem.graph.get_neighbors('Deployment')])
+    
     def test_topological_sort(self):
         order = self.problem.topological_sort()
         self.assertIsNotNone(order)